@@ -16,6 +16,15 @@ Key functionalities include:
 - Aggregating thermodynamic properties for a system of multiple substances, considering partial pressures
   for gas-phase species and normalization for condensed-phase species.
 
+Functions:
+    _enthalpy, _entropy, _heat_capacity, _gibbs_energy: Module-level implementations of the individual
+        substance calculations, exposed through `ThermodynamicIndividualCalculator`.
+    _temperature_powers, _log_pressure_ratios: Shared helpers for the reduced temperature powers and the
+        ln(p/p°) terms of gas-phase species.
+    _gibbs_coefficients: Scales raw coefficients into the stacked Gibbs coefficient layout.
+    _gibbs_energy_kernel, _gibbs_energy_gradient_kernel: Array-only kernels for the total Gibbs free energy
+        of a system and its gradient, exposed through `ThermodynamicSystemCalculator`.
+
 Classes:
     ThermodynamicIndividualCalculator: Provides static methods for thermodynamic property calculations
         for individual substances.
@@ -25,123 +34,249 @@ Classes:
         across a system of multiple substances.
 """
 
+import math
 import numpy as np
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
 
-from constants import CALORIE_TO_JOULES, GAS_CONSTANT, STANDARD_PRESSURE
+from constants import CALORIE_TO_JOULES, GAS_CONSTANT, INV_STANDARD_PRESSURE
 
-class ThermodynamicIndividualCalculator:
-    """Provides static methods for thermodynamic property calculations for individual substances.
+# Factors applied to coefficients c3..c8 in the entropy polynomial (2, 1.5, 4/3, 1.25, 1.2, 7/6)
+_ENTROPY_INTEGRATION_FACTORS = np.arange(2, 8) / np.arange(1, 7)
 
-    These methods use thermodynamic coefficients derived from "Thermodynamic and Thermophysical
-    Properties of Combustion Products. Volume 1" by V.P. Glushko to compute enthalpy, entropy,
-    heat capacity, and Gibbs free energy for a single substance at a given temperature and pressure.
+# Factors applied to coefficients c2..c8 in the heat capacity polynomial (1, 2, ..., 7)
+_HEAT_CAPACITY_DERIVATIVE_FACTORS = np.arange(1, 8, dtype=np.float64)
+
+def _enthalpy(coefficients: np.ndarray, temperature: float) -> float:
+    """Calculate molar enthalpy using thermodynamic coefficients from Glushko's work.
+
+    Args:
+        coefficients (np.ndarray): Array of 9 thermodynamic coefficients derived from Glushko's work.
+        temperature (float): Current temperature in Kelvin.
+
+    Returns:
+        float: Enthalpy in J/mol.
+
+    Notes:
+        - The coefficients are assumed to be in calorie-based units and are converted to joules
+          using the `CALORIE_TO_JOULES` constant.
+        - The coefficients correspond to polynomial fits described in Glushko's work.
     """
+    t = temperature * 1e-3
 
-    @staticmethod
-    def calculate_enthalpy(coefficients: np.ndarray, temperature: float) -> float:
-        """Calculate molar enthalpy using thermodynamic coefficients from Glushko's work.
+    _, c1, c2, c3, c4, c5, c6, c7, c8 = np.asarray(coefficients, dtype=np.float64).tolist()
 
-        Args:
-            coefficients (np.ndarray): Array of 9 thermodynamic coefficients derived from Glushko's work.
-            temperature (float): Current temperature in Kelvin.
+    # Horner's rule, unrolled for the fixed degree: c1 + c2*t + ... + c8*t^7
+    return CALORIE_TO_JOULES * (c1 + t * (c2 + t * (c3 + t * (c4 + t * (c5 + t * (c6 + t * (c7 + t * c8)))))))
 
-        Returns:
-            float: Enthalpy in J/mol.
+def _entropy(coefficients: np.ndarray, temperature: float, partial_pressure: float = 0.0) -> float:
+    """Calculate molar entropy with optional pressure correction for gas-phase species.
 
-        Notes:
-            - The coefficients are assumed to be in calorie-based units and are converted to joules
-              using the `CALORIE_TO_JOULES` constant.
-            - The coefficients correspond to polynomial fits described in Glushko's work.
-        """
-        t = temperature * 1e-3
-        return CALORIE_TO_JOULES * (
-            coefficients[1]
-            + coefficients[2] * t
-            + coefficients[3] * t**2
-            + coefficients[4] * t**3
-            + coefficients[5] * t**4
-            + coefficients[6] * t**5
-            + coefficients[7] * t**6
-            + coefficients[8] * t**7
-        )
+    Args:
+        coefficients (np.ndarray): Array of 9 thermodynamic coefficients derived from Glushko's work.
+        temperature (float): Current temperature in Kelvin.
+        partial_pressure (float): Partial pressure in Pa (for gases). Default is 0.0.
 
-    @staticmethod
-    def calculate_entropy(coefficients: np.ndarray, temperature: float, partial_pressure: float = 0.0) -> float:
-        """Calculate molar entropy with optional pressure correction for gas-phase species.
+    Returns:
+        float: Entropy in J/(mol·K).
 
-        Args:
-            coefficients (np.ndarray): Array of 9 thermodynamic coefficients derived from Glushko's work.
-            temperature (float): Current temperature in Kelvin.
-            partial_pressure (float): Partial pressure in Pa (for gases). Default is 0.0.
+    Notes:
+        - If `partial_pressure` is provided, the entropy of mixing is subtracted using the ideal gas law.
+        - The coefficients correspond to polynomial fits described in Glushko's work.
+    """
+    t = temperature * 1e-3
 
-        Returns:
-            float: Entropy in J/(mol·K).
+    c0, _, c2, c3, c4, c5, c6, c7, c8 = np.asarray(coefficients, dtype=np.float64).tolist()
 
-        Notes:
-            - If `partial_pressure` is provided, the entropy of mixing is subtracted using the ideal gas law.
-            - The coefficients correspond to polynomial fits described in Glushko's work.
-        """
-        t = temperature * 1e-3
-        std_entropy = CALORIE_TO_JOULES * (
-            coefficients[0]
-            + 1e-3 * coefficients[2] * np.log(t)
-            + 1e-3 * (
-                2 * coefficients[3] * t
-                + 1.5 * coefficients[4] * t**2
-                + (4/3) * coefficients[5] * t**3
-                + 1.25 * coefficients[6] * t**4
-                + 1.2 * coefficients[7] * t**5
-                + (7/6) * coefficients[8] * t**6
-            )
-        )
+    # Horner's rule, unrolled for the fixed degree: 2*c3*t + 1.5*c4*t^2 + (4/3)*c5*t^3 + ... + (7/6)*c8*t^6
+    polynomial = t * (2 * c3 + t * (1.5 * c4 + t * (4 / 3 * c5 + t * (1.25 * c6 + t * (1.2 * c7 + t * (7 / 6 * c8))))))
 
-        if partial_pressure > 0:
-            std_entropy -= GAS_CONSTANT * np.log(partial_pressure / STANDARD_PRESSURE)
+    std_entropy = CALORIE_TO_JOULES * (
+        c0
+        + 1e-3 * c2 * math.log(t)
+        + 1e-3 * polynomial
+    )
 
-        return std_entropy
+    if partial_pressure > 0:
+        std_entropy -= GAS_CONSTANT * math.log(partial_pressure * INV_STANDARD_PRESSURE)
 
-    @staticmethod
-    def calculate_heat_capacity(coefficients: np.ndarray, temperature: float) -> float:
-        """Calculate heat capacity using thermodynamic coefficients from Glushko's work.
+    return std_entropy
 
-        Args:
-            coefficients (np.ndarray): Array of 9 thermodynamic coefficients derived from Glushko's work.
-            temperature (float): Current temperature in Kelvin.
+def _heat_capacity(coefficients: np.ndarray, temperature: float) -> float:
+    """Calculate heat capacity using thermodynamic coefficients from Glushko's work.
 
-        Returns:
-            float: Heat capacity in J/(mol·K).
+    Args:
+        coefficients (np.ndarray): Array of 9 thermodynamic coefficients derived from Glushko's work.
+        temperature (float): Current temperature in Kelvin.
 
-        Notes:
-            - The coefficients correspond to polynomial fits described in Glushko's work.
-        """
-        t = temperature * 1e-3
-        return CALORIE_TO_JOULES * 1e-3 * (
-            coefficients[2]
-            + 2 * coefficients[3] * t
-            + 3 * coefficients[4] * t**2
-            + 4 * coefficients[5] * t**3
-            + 5 * coefficients[6] * t**4
-            + 6 * coefficients[7] * t**5
-            + 7 * coefficients[8] * t**6
-        )
+    Returns:
+        float: Heat capacity in J/(mol·K).
 
-    @staticmethod
-    def calculate_gibbs_energy(enthalpy: float, entropy: float, temperature: float) -> float:
-        """Calculate Gibbs free energy using enthalpy and entropy.
+    Notes:
+        - The coefficients correspond to polynomial fits described in Glushko's work.
+    """
+    t = temperature * 1e-3
 
-        Args:
-            enthalpy (float): Enthalpy in J/mol.
-            entropy (float): Entropy in J/(mol·K).
-            temperature (float): Current temperature in Kelvin.
+    _, _, c2, c3, c4, c5, c6, c7, c8 = np.asarray(coefficients, dtype=np.float64).tolist()
 
-        Returns:
-            float: Gibbs free energy in J/mol.
-        """
-        return enthalpy - temperature * entropy
+    # Horner's rule over the derivative coefficients, unrolled for the fixed degree: c2 + 2*c3*t + ... + 7*c8*t^6
+    cp = c2 + t * (2 * c3 + t * (3 * c4 + t * (4 * c5 + t * (5 * c6 + t * (6 * c7 + t * (7 * c8))))))
+
+    return CALORIE_TO_JOULES * 1e-3 * cp
+
+def _gibbs_energy(enthalpy: float, entropy: float, temperature: float) -> float:
+    """Calculate Gibbs free energy using enthalpy and entropy.
+
+    Args:
+        enthalpy (float): Enthalpy in J/mol.
+        entropy (float): Entropy in J/(mol·K).
+        temperature (float): Current temperature in Kelvin.
+
+    Returns:
+        float: Gibbs free energy in J/mol.
+    """
+    return enthalpy - temperature * entropy
 
-@dataclass
+def _gibbs_coefficients(coefficients: np.ndarray) -> np.ndarray:
+    """Scale raw thermodynamic coefficients into stacked enthalpy, entropy and ln(t) entropy coefficients.
+
+    Args:
+        coefficients (np.ndarray): Thermodynamic coefficients derived from Glushko's work (N × 9).
+
+    Returns:
+        np.ndarray: Coefficients in SI units (N × 16): enthalpy coefficients in J/mol applied to
+            [1, t, ..., t^7], entropy coefficients in J/(mol·K) applied to [1, t, ..., t^6], and the
+            coefficient of the ln(t) entropy term in J/(mol·K).
+    """
+    return CALORIE_TO_JOULES * np.hstack((
+        coefficients[:, 1:9],
+        coefficients[:, 0:1],
+        1e-3 * _ENTROPY_INTEGRATION_FACTORS * coefficients[:, 3:9],
+        1e-3 * coefficients[:, 2:3]
+    ))
+
+def _temperature_powers(temperature: float) -> np.ndarray:
+    """Calculate the powers of the reduced temperature used by the polynomial fits.
+
+    Args:
+        temperature (float): Current temperature in Kelvin.
+
+    Returns:
+        np.ndarray: Vector [1, t, t^2, ..., t^7] with t = temperature * 1e-3.
+    """
+    t = temperature * 1e-3
+    powers = np.empty(8, dtype=np.float64)
+    powers[0] = 1.0
+    for k in range(1, 8):
+        powers[k] = powers[k - 1] * t
+    return powers
+
+def _log_pressure_ratios(gas_amounts: np.ndarray, total_gas_moles: float, pressure: float) -> np.ndarray:
+    """Calculate ln(p_i/p°) for gas-phase species from their amounts.
+
+    Args:
+        gas_amounts (np.ndarray): Amounts of the gas-phase species in moles.
+        total_gas_moles (float): Total moles of gas-phase species.
+        pressure (float): System pressure in Pascals (Pa).
+
+    Returns:
+        np.ndarray: Dimensionless pressure terms, one per entry of `gas_amounts`, zero where the partial
+            pressure is not positive. All terms are zero when `total_gas_moles` is not positive (all
+            species condensed or all gas amounts zero).
+    """
+    if not total_gas_moles > 0:
+        return np.zeros(len(gas_amounts), dtype=np.float64)
+
+    # Non-positive partial pressures are clamped to zero and skipped by the masked logarithm
+    pressure_ratios = gas_amounts * (pressure * INV_STANDARD_PRESSURE / total_gas_moles)
+    np.maximum(pressure_ratios, 0.0, out=pressure_ratios)
+    return np.log(pressure_ratios, out=pressure_ratios, where=pressure_ratios > 0)
+
+def _standard_gibbs_energy_basis(temperature: float) -> np.ndarray:
+    """Build the temperature basis matching the column layout of `ThermodynamicSystemContext.gibbs_coefficients`.
+
+    Args:
+        temperature (float): Current temperature in Kelvin.
+
+    Returns:
+        np.ndarray: Vector [1, t, ..., t^7, -T, -T*t, ..., -T*t^6, -T*ln(t)] with t = temperature * 1e-3.
+    """
+    powers = _temperature_powers(temperature)
+    basis = np.empty(16, dtype=np.float64)
+    basis[0:8] = powers
+    basis[8:15] = -temperature * powers[0:7]
+    basis[15] = -temperature * math.log(powers[1])
+    return basis
+
+def _gibbs_energy_gradient_kernel(substance_amounts: np.ndarray,
+                                  standard_gibbs_energies: np.ndarray,
+                                  gas_indices: np.ndarray,
+                                  temperature: float,
+                                  pressure: float) -> np.ndarray:
+    """Calculate the chemical potentials of all species of a system.
+
+    The standard-state Gibbs energies depend on temperature only, so callers evaluating many compositions
+    at one temperature compute them once with
+    `gibbs_coefficients @ ThermodynamicSystemCalculator.build_standard_gibbs_energy_basis(T)`.
+
+    Args:
+        substance_amounts (np.ndarray): Substance amounts in moles (N).
+        standard_gibbs_energies (np.ndarray): Standard-state Gibbs energies G_i° in J/mol (N).
+        gas_indices (np.ndarray): Indices of the gas-phase species.
+        temperature (float): Current temperature in Kelvin.
+        pressure (float): System pressure in Pascals (Pa).
+
+    Returns:
+        np.ndarray: Chemical potentials in J/mol (N), μ_i = G_i° + R*T*ln(p_i/p°) for gas-phase species
+            with a positive partial pressure and μ_i = G_i° otherwise.
+    """
+    gas_amounts = substance_amounts[gas_indices]
+    pressure_terms = _log_pressure_ratios(gas_amounts, gas_amounts.sum(), pressure)
+
+    chemical_potentials = standard_gibbs_energies.copy()
+    chemical_potentials[gas_indices] += GAS_CONSTANT * temperature * pressure_terms
+    return chemical_potentials
+
+def _gibbs_energy_kernel(substance_amounts: np.ndarray,
+                         standard_gibbs_energies: np.ndarray,
+                         gas_indices: np.ndarray,
+                         temperature: float,
+                         pressure: float) -> float:
+    """Calculate the total Gibbs free energy of a system.
+
+    Args:
+        substance_amounts (np.ndarray): Substance amounts in moles (N).
+        standard_gibbs_energies (np.ndarray): Standard-state Gibbs energies G_i° in J/mol (N).
+        gas_indices (np.ndarray): Indices of the gas-phase species.
+        temperature (float): Current temperature in Kelvin.
+        pressure (float): System pressure in Pascals (Pa).
+
+    Returns:
+        float: Total Gibbs free energy in J.
+    """
+    chemical_potentials = _gibbs_energy_gradient_kernel(
+        substance_amounts, standard_gibbs_energies, gas_indices, temperature, pressure
+    )
+    return float(substance_amounts @ chemical_potentials)
+
+class ThermodynamicIndividualCalculator:
+    """Provides static methods for thermodynamic property calculations for individual substances.
+
+    These methods use thermodynamic coefficients derived from "Thermodynamic and Thermophysical
+    Properties of Combustion Products. Volume 1" by V.P. Glushko to compute enthalpy, entropy,
+    heat capacity, and Gibbs free energy for a single substance at a given temperature and pressure.
+
+    The methods are thin aliases of the module-level functions `_enthalpy`, `_entropy`,
+    `_heat_capacity` and `_gibbs_energy`, which callers inside this module use directly.
+    """
+
+    calculate_enthalpy = staticmethod(_enthalpy)
+    calculate_entropy = staticmethod(_entropy)
+    calculate_heat_capacity = staticmethod(_heat_capacity)
+    calculate_gibbs_energy = staticmethod(_gibbs_energy)
+
+@dataclass(slots=True)
 class ThermodynamicSystemContext:
     """Represents the context for thermodynamic system calculations.
 
@@ -152,12 +287,71 @@ class ThermodynamicSystemContext:
         coefficients (np.ndarray): Array of thermodynamic coefficients derived from Glushko's work
             for each species.
         is_condensed (np.ndarray): Boolean array indicating whether each species is in the condensed phase.
+        enthalpy_coefficients (np.ndarray): Enthalpy polynomial coefficients in J/mol (N × 8),
+            applied to [1, t, ..., t^7].
+        entropy_coefficients (np.ndarray): Entropy polynomial coefficients in J/(mol·K) (N × 7),
+            applied to [1, t, ..., t^6].
+        entropy_log_coefficients (np.ndarray): Coefficients of the ln(t) entropy term in J/(mol·K) (N).
+        heat_capacity_coefficients (np.ndarray): Heat capacity polynomial coefficients in J/(mol·K) (N × 7),
+            applied to [1, t, ..., t^6].
+        gibbs_coefficients (np.ndarray): Enthalpy, entropy and ln(t) entropy coefficients stacked side by
+            side (N × 16), so standard-state Gibbs energies take a single matrix-vector product.
+        gas_mask (np.ndarray): Float array with 1.0 for gas-phase species and 0.0 for condensed species.
+        condensed_mask (np.ndarray): Float array with 1.0 for condensed species and 0.0 for gas-phase species.
+        gas_indices (np.ndarray): Indices of the gas-phase species.
+        total_gas_moles (float): Total moles of gas-phase species (computed lazily).
+
+    Args:
+        substance_amounts (np.ndarray): Substance amounts in moles. The context stores a read-only float64
+            copy, so later changes to the caller's array do not affect it.
+
+    Note:
+        - The scaled coefficient matrices and the gas mask are derived from `coefficients` and
+          `is_condensed` once at construction, so the system calculations only evaluate plain polynomials.
+        - `total_gas_moles` is cached until `substance_amounts` is reassigned. The stored amounts are a
+          read-only copy, so they cannot be modified in place behind the cache.
+        - Instances use `__slots__` instead of a per-instance `__dict__`; `__setattr__` therefore calls
+          `object.__setattr__` directly, since zero-argument `super()` does not work in slotted dataclasses.
     """
     temperature: float
     pressure: float
     substance_amounts: np.ndarray
     coefficients: np.ndarray
     is_condensed: np.ndarray
+    enthalpy_coefficients: np.ndarray = field(init=False, repr=False)
+    entropy_coefficients: np.ndarray = field(init=False, repr=False)
+    entropy_log_coefficients: np.ndarray = field(init=False, repr=False)
+    heat_capacity_coefficients: np.ndarray = field(init=False, repr=False)
+    gibbs_coefficients: np.ndarray = field(init=False, repr=False)
+    gas_mask: np.ndarray = field(init=False, repr=False)
+    condensed_mask: np.ndarray = field(init=False, repr=False)
+    gas_indices: np.ndarray = field(init=False, repr=False)
+    _total_gas_moles: Optional[float] = field(init=False, repr=False, compare=False, default=None)
+
+    def __setattr__(self, name, value):
+        if name == "substance_amounts":
+            value = np.array(value, dtype=np.float64)
+            value.flags.writeable = False
+            object.__setattr__(self, "_total_gas_moles", None)
+        object.__setattr__(self, name, value)
+
+    @property
+    def total_gas_moles(self) -> float:
+        """float: Total moles of gas-phase species, computed on first access after `substance_amounts` is set."""
+        if self._total_gas_moles is None:
+            self._total_gas_moles = float(np.dot(self.substance_amounts, self.gas_mask))
+        return self._total_gas_moles
+
+    def __post_init__(self):
+        coefficients = self.coefficients
+        self.gibbs_coefficients = _gibbs_coefficients(coefficients)
+        self.enthalpy_coefficients = self.gibbs_coefficients[:, 0:8]
+        self.entropy_coefficients = self.gibbs_coefficients[:, 8:15]
+        self.entropy_log_coefficients = self.gibbs_coefficients[:, 15]
+        self.heat_capacity_coefficients = CALORIE_TO_JOULES * 1e-3 * _HEAT_CAPACITY_DERIVATIVE_FACTORS * coefficients[:, 2:9]
+        self.gas_mask = (~self.is_condensed).astype(np.float64)
+        self.condensed_mask = self.is_condensed.astype(np.float64)
+        self.gas_indices = np.flatnonzero(~self.is_condensed)
 
 class ThermodynamicSystemCalculator:
     """Provides static methods for aggregating thermodynamic properties across a system of multiple substances.
@@ -165,30 +359,36 @@ class ThermodynamicSystemCalculator:
     These methods calculate total enthalpy, entropy, heat capacity, and Gibbs free energy for a system,
     accounting for both gas-phase and condensed-phase species. The thermodynamic coefficients are derived
     from "Thermodynamic and Thermophysical Properties of Combustion Products. Volume 1" by V.P. Glushko.
+
+    The per-species polynomials are evaluated for all species at once as a matrix-vector product of the
+    context's scaled coefficient matrices with a vector of powers of the reduced temperature.
+
+    The array-only Gibbs energy kernels are exposed as `build_gibbs_coefficients`,
+    `build_standard_gibbs_energy_basis`, `calculate_gibbs_energy_kernel` and
+    `calculate_gibbs_energy_gradient_kernel`, so callers that evaluate many compositions at one
+    temperature (such as the composition optimizer) can skip the context entirely.
     """
 
+    build_gibbs_coefficients = staticmethod(_gibbs_coefficients)
+    build_standard_gibbs_energy_basis = staticmethod(_standard_gibbs_energy_basis)
+    calculate_gibbs_energy_kernel = staticmethod(_gibbs_energy_kernel)
+    calculate_gibbs_energy_gradient_kernel = staticmethod(_gibbs_energy_gradient_kernel)
+
     @staticmethod
-    def calculate_enthalpy(context: ThermodynamicSystemContext) -> float:
+    def calculate_enthalpy(context: ThermodynamicSystemContext, out: np.ndarray = None) -> float:
         """Calculate total enthalpy of the system.
 
         Args:
             context (ThermodynamicSystemContext): Context containing system parameters.
+            out (np.ndarray): Optional preallocated float64 buffer (N) that receives the per-species
+                enthalpies, so repeated evaluations do not allocate a new array. Default is None.
 
         Returns:
             float: Total enthalpy in J.
         """
-        substance_amounts = context.substance_amounts
-        coefficients = context.coefficients
-        temperature = context.temperature
-        total_enthalpy = 0.0
-
-        for i in range(len(substance_amounts)):
-            q = substance_amounts[i]
-            coeffs = coefficients[i]
-            h = ThermodynamicIndividualCalculator.calculate_enthalpy(coeffs, temperature)
-            total_enthalpy += q * h
-
-        return total_enthalpy
+        powers = _temperature_powers(context.temperature)
+        enthalpies = ThermodynamicSystemCalculator._calculate_species_enthalpies(context, powers, out)
+        return float(context.substance_amounts @ enthalpies)
 
     @staticmethod
     def calculate_entropy(context: ThermodynamicSystemContext) -> float:
@@ -200,25 +400,9 @@ class ThermodynamicSystemCalculator:
         Returns:
             float: Total entropy in J/K.
         """
-        substance_amounts = context.substance_amounts
-        coefficients = context.coefficients
-        is_condensed = context.is_condensed
-        temperature = context.temperature
-        pressure = context.pressure
-        total_entropy = 0.0
-        total_gas_moles = np.sum(substance_amounts * ~is_condensed)
-
-        for i in range(len(substance_amounts)):
-            q = substance_amounts[i]
-            coeffs = coefficients[i]
-            condensed_flag = is_condensed[i]
-            partial_pressure = ThermodynamicSystemCalculator._calculate_partial_pressure(
-                pressure, q, total_gas_moles, condensed_flag
-            )
-            s = ThermodynamicIndividualCalculator.calculate_entropy(coeffs, temperature, partial_pressure)
-            total_entropy += q * s
-
-        return total_entropy
+        powers = _temperature_powers(context.temperature)
+        entropies = ThermodynamicSystemCalculator._calculate_species_entropies(context, powers)
+        return float(context.substance_amounts @ entropies)
 
     @staticmethod
     def calculate_heat_capacity(context: ThermodynamicSystemContext) -> float:
@@ -230,82 +414,176 @@ class ThermodynamicSystemCalculator:
         Returns:
             float: Total heat capacity in J/K.
         """
-        substance_amounts = context.substance_amounts
-        coefficients = context.coefficients
-        is_condensed = context.is_condensed
-        temperature = context.temperature
-        total_heat_capacity = 0.0
-        total_gas_moles = np.sum(substance_amounts * ~is_condensed)
+        normalized_amounts = ThermodynamicSystemCalculator._calculate_normalized_amounts(context)
 
-        for i in range(len(substance_amounts)):
-            q = substance_amounts[i]
-            coeffs = coefficients[i]
-            condensed_flag = is_condensed[i]
-            n = ThermodynamicSystemCalculator._calculate_substance_amount_over_total_gas_moles(
-                q, total_gas_moles, condensed_flag
-            )
-            cp = ThermodynamicIndividualCalculator.calculate_heat_capacity(coeffs, temperature)
-            total_heat_capacity += n * cp
-
-        return total_heat_capacity
+        powers = _temperature_powers(context.temperature)
+        heat_capacities = ThermodynamicSystemCalculator._calculate_species_heat_capacities(context, powers)
+        return float(normalized_amounts @ heat_capacities)
 
     @staticmethod
     def calculate_gibbs_energy(context: ThermodynamicSystemContext) -> float:
         """Calculate total Gibbs free energy of the system.
 
+        The total is the sum of the substance amounts weighted by the chemical potentials from
+        `calculate_gibbs_energy_gradient`: standard-state Gibbs energies H - T*S° evaluated in one pass over
+        the stacked Gibbs coefficient matrix, plus R*T*ln(p/p°) for gas-phase species.
+
         Args:
             context (ThermodynamicSystemContext): Context containing system parameters.
 
         Returns:
             float: Total Gibbs free energy in J.
         """
-        substance_amounts = context.substance_amounts
-        coefficients = context.coefficients
-        is_condensed = context.is_condensed
+        return _gibbs_energy_kernel(
+            context.substance_amounts,
+            context.gibbs_coefficients @ _standard_gibbs_energy_basis(context.temperature),
+            context.gas_indices, context.temperature, context.pressure
+        )
+
+    @staticmethod
+    def calculate_gibbs_energy_gradient(context: ThermodynamicSystemContext) -> np.ndarray:
+        """Calculate the gradient of the total Gibbs free energy with respect to the substance amounts.
+
+        The partial derivatives are the chemical potentials of the species:
+        μ_i = G_i° + R*T*ln(p_i/p°) for gas-phase species and μ_i = G_i° for condensed species.
+        The terms arising from the dependence of the partial pressures on the total gas moles cancel out.
+
+        Args:
+            context (ThermodynamicSystemContext): Context containing system parameters.
+
+        Returns:
+            np.ndarray: Chemical potentials in J/mol (N).
+        """
+        return _gibbs_energy_gradient_kernel(
+            context.substance_amounts,
+            context.gibbs_coefficients @ _standard_gibbs_energy_basis(context.temperature),
+            context.gas_indices, context.temperature, context.pressure
+        )
+
+    @staticmethod
+    def calculate_totals(context: ThermodynamicSystemContext) -> Tuple[float, float, float]:
+        """Calculate total enthalpy, entropy, and Gibbs free energy of the system in one reduction.
+
+        The per-species enthalpies and entropies are stacked into an (N × 2) matrix and reduced against
+        the substance amounts in a single pass. The Gibbs free energy follows as H - T*S.
+
+        Args:
+            context (ThermodynamicSystemContext): Context containing system parameters.
+
+        Returns:
+            Tuple[float, float, float]: Total enthalpy in J, total entropy in J/K, and total Gibbs
+                free energy in J.
+        """
         temperature = context.temperature
-        pressure = context.pressure
-        total_gibbs_energy = 0.0
-        total_gas_moles = np.sum(substance_amounts * ~is_condensed)
-
-        for i in range(len(substance_amounts)):
-            q = substance_amounts[i]
-            coeffs = coefficients[i]
-            condensed_flag = is_condensed[i]
-            partial_pressure = ThermodynamicSystemCalculator._calculate_partial_pressure(
-                pressure, q, total_gas_moles, condensed_flag
-            )
-            h = ThermodynamicIndividualCalculator.calculate_enthalpy(coeffs, temperature)
-            s = ThermodynamicIndividualCalculator.calculate_entropy(coeffs, temperature, partial_pressure)
-            gibbs_energy = ThermodynamicIndividualCalculator.calculate_gibbs_energy(h, s, temperature)
-            total_gibbs_energy += q * gibbs_energy
-
-        return total_gibbs_energy
+
+        powers = _temperature_powers(temperature)
+        properties = np.column_stack((
+            ThermodynamicSystemCalculator._calculate_species_enthalpies(context, powers),
+            ThermodynamicSystemCalculator._calculate_species_entropies(context, powers)
+        ))
+        total_enthalpy, total_entropy = context.substance_amounts @ properties
+        return float(total_enthalpy), float(total_entropy), float(total_enthalpy - temperature * total_entropy)
+
+    @staticmethod
+    def _calculate_normalized_amounts(context: ThermodynamicSystemContext) -> np.ndarray:
+        """Calculate the amounts of all species relative to total gas-phase moles.
+
+        Args:
+            context (ThermodynamicSystemContext): Context containing system parameters.
+
+        Returns:
+            np.ndarray: Normalized amounts (dimensionless) (N), zero for condensed species and zero for all
+                species when the total gas-phase moles are not positive.
+        """
+        total_gas_moles = context.total_gas_moles
+        gas_amounts = context.substance_amounts * context.gas_mask
+        return np.divide(gas_amounts, total_gas_moles, out=np.zeros_like(gas_amounts), where=total_gas_moles > 0)
 
     @staticmethod
-    def _calculate_partial_pressure(total_pressure: float, substance_amount: float, total_gas_moles: float, is_condensed: bool) -> float:
-        """Calculate the partial pressure of a gas-phase species.
+    def _evaluate_polynomials(coefficient_matrix: np.ndarray, powers: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """Evaluate one polynomial per species against precomputed temperature powers.
 
         Args:
-            total_pressure (float): Total system pressure in Pascals (Pa).
-            substance_amount (float): Amount of the species in moles.
-            total_gas_moles (float): Total moles of gas-phase species.
-            is_condensed (bool): Flag indicating whether the species is in the condensed phase.
+            coefficient_matrix (np.ndarray): Polynomial coefficients (N × K), lowest order first.
+            powers (np.ndarray): Powers of the reduced temperature [1, t, ...] with at least K entries.
+            out (np.ndarray): Optional preallocated output buffer (N). Default is None.
 
         Returns:
-            float: Partial pressure in Pascals (Pa).
+            np.ndarray: Polynomial values (N).
         """
-        return total_pressure * (substance_amount / total_gas_moles) if not is_condensed else 0.0
+        return np.matmul(coefficient_matrix, powers[:coefficient_matrix.shape[1]], out=out)
 
     @staticmethod
-    def _calculate_substance_amount_over_total_gas_moles(substance_amount: float, total_gas_moles: float, is_condensed: bool) -> float:
-        """Calculate the normalized amount of a species relative to total gas-phase moles.
+    def _calculate_species_enthalpies(context: ThermodynamicSystemContext,
+                                      powers: np.ndarray,
+                                      out: np.ndarray = None) -> np.ndarray:
+        """Calculate molar enthalpies of all species.
 
         Args:
-            substance_amount (float): Amount of the species in moles.
-            total_gas_moles (float): Total moles of gas-phase species.
-            is_condensed (bool): Flag indicating whether the species is in the condensed phase.
+            context (ThermodynamicSystemContext): Context containing system parameters.
+            powers (np.ndarray): Powers of the reduced temperature from `_temperature_powers`.
+            out (np.ndarray): Optional preallocated output buffer (N). Default is None.
+
+        Returns:
+            np.ndarray: Enthalpies in J/mol (N).
+        """
+        return ThermodynamicSystemCalculator._evaluate_polynomials(context.enthalpy_coefficients, powers, out)
+
+    @staticmethod
+    def _calculate_species_standard_entropies(context: ThermodynamicSystemContext, powers: np.ndarray) -> np.ndarray:
+        """Calculate standard-state molar entropies of all species.
+
+        Args:
+            context (ThermodynamicSystemContext): Context containing system parameters.
+            powers (np.ndarray): Powers of the reduced temperature from `_temperature_powers`.
+
+        Returns:
+            np.ndarray: Standard-state entropies in J/(mol·K) (N).
+        """
+        return (
+            ThermodynamicSystemCalculator._evaluate_polynomials(context.entropy_coefficients, powers)
+            + context.entropy_log_coefficients * math.log(powers[1])
+        )
+
+    @staticmethod
+    def _calculate_species_entropies(context: ThermodynamicSystemContext, powers: np.ndarray) -> np.ndarray:
+        """Calculate molar entropies of all species with pressure correction for gas-phase species.
+
+        Args:
+            context (ThermodynamicSystemContext): Context containing system parameters.
+            powers (np.ndarray): Powers of the reduced temperature from `_temperature_powers`.
+
+        Returns:
+            np.ndarray: Entropies in J/(mol·K) (N).
+        """
+        entropies = ThermodynamicSystemCalculator._calculate_species_standard_entropies(context, powers)
+        entropies[context.gas_indices] -= GAS_CONSTANT * ThermodynamicSystemCalculator._calculate_pressure_terms(context)
+        return entropies
+
+    @staticmethod
+    def _calculate_pressure_terms(context: ThermodynamicSystemContext) -> np.ndarray:
+        """Calculate ln(p/p°) for the gas-phase species.
+
+        Args:
+            context (ThermodynamicSystemContext): Context containing system parameters.
+
+        Returns:
+            np.ndarray: Dimensionless pressure terms, one per entry of `context.gas_indices`, zero where
+                the partial pressure is not positive.
+        """
+        return _log_pressure_ratios(
+            context.substance_amounts[context.gas_indices], context.total_gas_moles, context.pressure
+        )
+
+    @staticmethod
+    def _calculate_species_heat_capacities(context: ThermodynamicSystemContext, powers: np.ndarray) -> np.ndarray:
+        """Calculate molar heat capacities of all species.
+
+        Args:
+            context (ThermodynamicSystemContext): Context containing system parameters.
+            powers (np.ndarray): Powers of the reduced temperature from `_temperature_powers`.
 
         Returns:
-            float: Normalized amount (dimensionless).
+            np.ndarray: Heat capacities in J/(mol·K) (N).
         """
-        return substance_amount / total_gas_moles if not is_condensed else 0.0
+        return ThermodynamicSystemCalculator._evaluate_polynomials(context.heat_capacity_coefficients, powers)
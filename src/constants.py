@@ -8,6 +8,8 @@ Constants:
         Value: 8.31446261815324 J/(mol·K).
     STANDARD_PRESSURE (float): Standard atmospheric pressure in pascals [Pa].
         Value: 101325.0 Pa.
+    INV_STANDARD_PRESSURE (float): Reciprocal of the standard atmospheric pressure [1/Pa].
+        Used to turn pressure ratios p/p° into multiplications.
     CALORIE_TO_JOULES (float): Conversion factor from calories to joules [J/cal].
         Value: 4.184 J/cal.
 
@@ -30,4 +32,6 @@ GAS_CONSTANT = 8.31446261815324
 
 STANDARD_PRESSURE = 101325.0
 
+INV_STANDARD_PRESSURE = 1.0 / STANDARD_PRESSURE
+
 CALORIE_TO_JOULES = 4.184
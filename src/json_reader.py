@@ -9,19 +9,51 @@ The JSON files must follow specific structures:
   thermodynamic coefficients, phase information, and temperature range.
 - For input substances: An object containing the enthalpy and chemical composition of the substance.
 
+If the optional `orjson` package is installed it is used to decode the files; otherwise the standard
+library `json` module is used.
+
 Functions:
-    load_combustion_products(filepath: str) -> List[ReactionProduct]: Loads combustion products
-        from a JSON file and returns a list of ReactionProduct objects.
+    load_combustion_products(filepath: str) -> ReactionProductTable: Loads combustion products
+        from a JSON file and returns them as a ReactionProductTable.
     load_input_substance(filepath: str) -> PropellantComposition: Loads input substance data
         from a JSON file and returns a PropellantComposition object.
 """
 
 import json
-from typing import List
-from models import ReactionProduct, TemperatureRange, PropellantComposition
+import numpy as np
+
+from typing import Any, List
+from models import ReactionProduct, ReactionProductTable, TemperatureRange, PropellantComposition
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _read_json(filepath: str) -> Any:
+    """Reads and decodes a JSON file, using `orjson` when it is available.
+
+    Args:
+        filepath (str): Path to the JSON file.
+
+    Returns:
+        Any: The decoded JSON document.
+
+    Raises:
+        FileNotFoundError: If the specified file does not exist.
+        json.JSONDecodeError: If the JSON file is malformed.
+    """
+    try:
+        with open(filepath, "rb") as file:
+            raw = file.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"The file '{filepath}' was not found.")
+    except json.JSONDecodeError as e:
+        raise json.JSONDecodeError(f"Invalid JSON in {filepath}: {e.msg}", e.doc, e.pos) from e
 
-def load_combustion_products(filepath: str) -> List[ReactionProduct]:
-    """Loads combustion products from a JSON file and returns a list of ReactionProduct objects.
+def load_combustion_products(filepath: str) -> ReactionProductTable:
+    """Loads combustion products from a JSON file and returns them as a ReactionProductTable.
 
     The JSON file must contain an array of objects, each with the following structure:
         {
@@ -46,45 +78,73 @@ def load_combustion_products(filepath: str) -> List[ReactionProduct]:
     These coefficients correspond to thermodynamic properties derived from tabulated data
     in Glushko's work and are used to compute properties such as enthalpy, entropy, and heat capacity.
 
+    The coefficients, phase flags and temperature ranges are copied in a single pass into
+    preallocated contiguous arrays. The coefficients of each `ReactionProduct` are views into
+    the rows of the table's coefficient matrix; the matrix and the views are read-only, so a
+    product cannot modify the shared table.
+
     Args:
         filepath (str): The path to the combustion products JSON file.
 
     Returns:
-        List[ReactionProduct]: A list of ReactionProduct domain objects.
+        ReactionProductTable: Table of ReactionProduct domain objects and their array data.
 
     Raises:
         FileNotFoundError: If the specified file does not exist.
         json.JSONDecodeError: If the JSON file is malformed.
         ValueError: If required keys ("formula", "coefficients", "phase", "temperature_range")
-            are missing in the JSON data.
+            are missing in the JSON data, or if a product does not have 9 coefficients.
     """
+    data = _read_json(filepath)
+
+    n_products = len(data)
     products: List[ReactionProduct] = []
-    try:
-        with open(filepath, "r", encoding="utf-8") as file:
-            data = json.load(file)
-    except FileNotFoundError:
-        raise FileNotFoundError(f"The file '{filepath}' was not found.")
-    except json.JSONDecodeError as e:
-        raise json.JSONDecodeError(f"Invalid JSON in {filepath}: {e.msg}", e.doc, e.pos) from e
+    formulas: List[str] = []
 
-    for item in data:
+    # 9 coefficients per polynomial fit
+    coefficients = np.empty((n_products, 9), dtype=np.float64)
+    is_condensed = np.empty(n_products, dtype=bool)
+    temperature_ranges = np.empty((n_products, 2), dtype=np.float64)
+
+    for idx, item in enumerate(data):
         try:
             temp_range = TemperatureRange(
                 min=item["temperature_range"]["min"],
                 max=item["temperature_range"]["max"]
             )
-            is_condensed = (item["phase"] == "condensed")
+            formula = item["formula"]
+            if len(item["coefficients"]) != 9:
+                raise ValueError(f"Invalid coefficients for {formula}")
+
+            coefficients[idx] = item["coefficients"]
+            is_condensed[idx] = (item["phase"] == "condensed")
+            temperature_ranges[idx] = temp_range
+
+            # Row views keep their own flags, so each one is locked as well as the matrix below
+            product_coefficients = coefficients[idx]
+            product_coefficients.flags.writeable = False
+
             product = ReactionProduct(
-                formula=item["formula"],
-                coefficients=item["coefficients"],
+                formula=formula,
+                coefficients=product_coefficients,
                 phase=item["phase"],
                 temperature_range=temp_range,
-                is_condensed=is_condensed
+                is_condensed=bool(is_condensed[idx])
             )
             products.append(product)
+            formulas.append(formula)
         except KeyError as error:
             raise ValueError(f"Missing key in combustion product data: {error}")
-    return products
+
+    coefficients.flags.writeable = False
+
+    return ReactionProductTable(
+        products=products,
+        formulas=formulas,
+        coefficients=coefficients,
+        is_condensed=is_condensed,
+        temperature_ranges=temperature_ranges
+    )
 
 def load_input_substance(filepath: str) -> PropellantComposition:
     """Loads input substance data from a JSON file and returns a PropellantComposition object.
@@ -112,13 +172,7 @@ def load_input_substance(filepath: str) -> PropellantComposition:
         json.JSONDecodeError: If the JSON file is malformed.
         ValueError: If required keys ("enthalpy", "composition") are missing in the JSON data.
     """
-    try:
-        with open(filepath, "r", encoding="utf-8") as file:
-            data = json.load(file)
-    except FileNotFoundError:
-        raise FileNotFoundError(f"The file '{filepath}' was not found.")
-    except json.JSONDecodeError as e:
-        raise json.JSONDecodeError(f"Invalid JSON in {filepath}: {e.msg}", e.doc, e.pos) from e
+    data = _read_json(filepath)
 
     try:
         return PropellantComposition(
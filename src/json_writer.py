@@ -3,39 +3,48 @@
 This module provides utility functions to structure and write the results of
 thermodynamic optimization into a JSON file. The output includes input substance parameters,
 combustion products (formula, phase, and moles), and the resulting optimal temperature.
+
+If the optional `orjson` package is installed it is used to serialize the results; otherwise the
+standard library `json` module is used. The two backends write the same data but not byte-identical
+files: orjson indents with two spaces (the only indentation it supports), writes NaN and infinities as
+`null`, and formats exponents without padding (`1e20`, `1.75e-6`), while the `json` module keeps the
+original four-space indentation, writes `NaN`/`Infinity`, and formats exponents as `1e+20`, `1.75e-06`.
 """
 
 import json
 
 from typing import List
 
-from models import PropellantComposition, ReactionProduct
+from models import PropellantComposition, ReactionProductTable
 from calculators import ThermodynamicSystemContext
 from thermodynamic_properties import ThermodynamicPropertiesContext
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def prepare_combustion_products(
     context: ThermodynamicSystemContext,
-    filtered_products: List[ReactionProduct]
+    filtered_products: ReactionProductTable
 ) -> List[dict]:
     """
     Prepares a list of combustion products with their formula, phase, and moles.
 
     Args:
         context (ThermodynamicSystemContext): Optimized thermodynamic system context.
-        filtered_products (List[ReactionProduct]): List of filtered reaction products.
+        filtered_products (ReactionProductTable): Filtered reaction products, in the order of the substance amounts.
 
     Returns:
         List[dict]: List of dictionaries representing combustion products.
     """
-    combustion_products = []
-    for product, amount in zip(filtered_products, context.substance_amounts):
-        combustion_products.append({
-            "formula": product.formula,
-            "phase": product.phase,
-            "moles": float(amount)  # Ensure amount is converted to float for JSON serialization
-        })
-    return combustion_products
+    # tolist() converts all amounts to Python floats for JSON serialization in a single call
+    amounts = context.substance_amounts.tolist()
+    return [
+        {"formula": product.formula, "phase": product.phase, "moles": amount}
+        for product, amount in zip(filtered_products, amounts)
+    ]
 
 
 def write_to_json(
@@ -43,7 +52,7 @@ def write_to_json(
     propellant: PropellantComposition,
     total_mass: float,
     context: ThermodynamicPropertiesContext,
-    filtered_products: List[ReactionProduct]
+    filtered_products: ReactionProductTable
 ):
     """
     Writes the optimization result to a JSON file.
@@ -52,26 +61,30 @@ def write_to_json(
         file_path (str): Path to the output JSON file.
         propellant (PropellantComposition): Input propellant composition.
         total_mass (float): Total mass of the propellant in kilograms (kg).
-        context (ThermodynamicSystemContext): Optimized thermodynamic system context.
-        filtered_products (List[ReactionProduct]): List of filtered reaction products.
+        context (ThermodynamicPropertiesContext): Thermodynamic properties of the optimized system.
+        filtered_products (ReactionProductTable): Filtered reaction products, in the order of the substance amounts.
     """
     # Prepare combustion products
     combustion_products_data = prepare_combustion_products(context.thermodynamic_system_context, filtered_products)
 
-    # Prepare the overall result
+    # Prepare the overall result (NumPy float64 scalars serialize natively with both backends)
     result = {
         "pressure": context.thermodynamic_system_context.pressure,
-        "temperature": float(context.thermodynamic_system_context.temperature),  # Ensure temperature is converted to float
-        "specific_heat_capacity_volumetric": float(context.specific_heat_capacity_volumetric),  # Ensure heat capacity is converted to float
-        "gas_average_molar_mass": float(context.gas_average_molar_mass),  # Ensure molar mass is converted to float
+        "temperature": context.thermodynamic_system_context.temperature,
+        "specific_heat_capacity_volumetric": context.specific_heat_capacity_volumetric,
+        "gas_average_molar_mass": context.gas_average_molar_mass,
         "propellant": {
             "enthalpy": propellant.enthalpy,
             "composition": propellant.composition,
-            "total_mass_kg": float(total_mass)  # Add total mass to the output
+            "total_mass_kg": total_mass  # Add total mass to the output
         },
         "combustion_products": combustion_products_data
     }
 
     # Write to JSON file
-    with open(file_path, "w", encoding="utf-8") as file:
-        json.dump(result, file, indent=4)
+    if orjson is not None:
+        with open(file_path, "wb") as file:
+            file.write(orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2))
+    else:
+        with open(file_path, "w", encoding="utf-8") as file:
+            json.dump(result, file, indent=4)
@@ -7,7 +7,7 @@ from json_reader import load_combustion_products, load_input_substance
 from json_writer import write_to_json
 from optimization import TemperatureOptimizer
 from thermodynamic_properties import ThermodynamicPropertiesCalculator
-from utils import filter_and_construct_matrices, compute_total_mass
+from utils import compute_total_mass
 
 def main():
     # Set up argument parser
@@ -57,8 +57,8 @@ def main():
         print(f"Loaded {len(combustion_products)} combustion products")
 
         # Define temperature bounds
-        min_temperature = min(product.temperature_range.min for product in combustion_products)
-        max_temperature = max(product.temperature_range.max for product in combustion_products)
+        min_temperature = combustion_products.temperature_ranges[:, 0].min()
+        max_temperature = combustion_products.temperature_ranges[:, 1].max()
         delta_temperature = 1e-3
 
         # Optimize temperature
@@ -74,10 +74,8 @@ def main():
         print("Optimal Temperature:", optimal_temperature)
 
         # Get optimized context and filtered products
-        context = optimizer.optimize_context_at_temperature(optimal_temperature)
-        filtered_products, _ = filter_and_construct_matrices(
-            optimizer.products, optimizer.propellant, optimal_temperature
-        )
+        context = optimizer.optimal_context
+        filtered_products = optimizer.filtered_products
 
         # Calculate additional thermodynamic properties
         print("Calculating thermodynamic properties...")
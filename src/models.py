@@ -1,17 +1,20 @@
 """Module for thermodynamic equilibrium calculations in combustion processes.
 
 This module provides classes to represent chemical formulas, reaction products,
-and temperature ranges for use in thermodynamic equilibrium computations based on
+tables of reaction products, and temperature ranges for use in thermodynamic equilibrium computations based on
 thermodynamic and thermophysical properties of combustion products as described in:
 "Thermodynamic and Thermophysical Properties of Combustion Products. Volume 1"
 by V.P. Glushko.
 
 """
 
-from dataclasses import dataclass
+import numpy as np
 
-@dataclass(frozen=True)
-class TemperatureRange:
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Iterator, List, Mapping, NamedTuple, Tuple
+
+class TemperatureRange(NamedTuple):
     """Represents a valid temperature range for thermodynamic properties.
 
     Attributes:
@@ -23,13 +26,13 @@ class TemperatureRange:
         max (float): Maximum temperature in Kelvin.
 
     Note:
-        This class is immutable due to the `frozen=True` decorator.
+        This class is an immutable, hashable named tuple, so it unpacks as `(min, max)`.
     """
     min: float
     max: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PropellantComposition:
     """Represents the chemical composition of a rocket propellant, expressed as a conditional
     chemical formula for 1 kg of propellant. The composition specifies the molar quantities
@@ -60,10 +63,40 @@ class PropellantComposition:
     Note:
         - The molar quantities in `composition` must satisfy the condition:
           sum(moles * molar_mass for element, moles in composition.items()) == 1 kg.
-        - This class is immutable due to the `frozen=True` decorator.
+        - This class is immutable due to the `frozen=True` decorator and stores its fields in
+          `__slots__` instead of a per-instance `__dict__`.
+        - The element symbols and molar quantities are also materialized as the parallel
+          `elements` tuple and read-only `moles` float64 array, in `composition` order, together with
+          the read-only `element_index` mapping of each element symbol to its position.
     """
     enthalpy: float
     composition: dict[str, float]
+    _elements: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _moles: np.ndarray = field(init=False, repr=False, compare=False)
+    _element_index: Mapping[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_elements", tuple(self.composition.keys()))
+        moles = np.fromiter(self.composition.values(), dtype=np.float64, count=len(self.composition))
+        moles.flags.writeable = False
+        object.__setattr__(self, "_moles", moles)
+        object.__setattr__(self, "_element_index",
+                           MappingProxyType({element: idx for idx, element in enumerate(self._elements)}))
+
+    @property
+    def elements(self) -> Tuple[str, ...]:
+        """Tuple[str, ...]: Element symbols in `composition` order."""
+        return self._elements
+
+    @property
+    def moles(self) -> np.ndarray:
+        """np.ndarray: Read-only molar quantities of the elements (float64), aligned with `elements`."""
+        return self._moles
+
+    @property
+    def element_index(self) -> Mapping[str, int]:
+        """Mapping[str, int]: Read-only mapping of each element symbol to its position in `elements`."""
+        return self._element_index
 
 
 @dataclass(frozen=True)
@@ -74,7 +107,7 @@ class ReactionProduct:
 
     Attributes:
         formula (str): Chemical formula of the product (e.g., 'CO2', 'H2O').
-        coefficients (list[float]): Thermodynamic coefficients for property calculations.
+        coefficients (np.ndarray): Thermodynamic coefficients (9) for property calculations.
             These coefficients are derived from tabulated data in Glushko's work and
             are typically used in polynomial fits for enthalpy, entropy, and heat capacity.
         phase (str): Physical phase of the product. Possible values: 'gas', 'condensed'.
@@ -83,7 +116,7 @@ class ReactionProduct:
 
     Args:
         formula (str): Chemical formula of the product.
-        coefficients (list[float]): Thermodynamic coefficients for property calculations.
+        coefficients (np.ndarray): Thermodynamic coefficients (9) for property calculations.
         phase (str): Physical phase of the product ('gas' or 'condensed').
         temperature_range (TemperatureRange): Valid temperature range for the coefficients.
         is_condensed (bool): Indicates if the product is in a condensed phase.
@@ -92,7 +125,72 @@ class ReactionProduct:
         This class is immutable due to the `frozen=True` decorator.
     """
     formula: str
-    coefficients: list[float]
+    coefficients: np.ndarray
     phase: str
     temperature_range: TemperatureRange
     is_condensed: bool
+
+
+@dataclass(frozen=True)
+class ReactionProductTable:
+    """Stores a set of reaction products as contiguous per-field arrays (struct of arrays).
+
+    The numeric data of all products is laid out in contiguous float64/bool arrays so that
+    thermodynamic calculations can operate on whole columns instead of walking individual
+    `ReactionProduct` objects. The table also behaves as a read-only sequence of the original
+    `ReactionProduct` objects, which are kept for reporting.
+
+    Attributes:
+        products (List[ReactionProduct]): Reaction products in table order.
+        formulas (List[str]): Chemical formulas of the products.
+        coefficients (np.ndarray): Thermodynamic coefficients (N × 9), C-contiguous float64.
+        is_condensed (np.ndarray): Boolean flags for condensed-phase products (N).
+        temperature_ranges (np.ndarray): Valid temperature ranges (N × 2) as [min, max] rows in Kelvin.
+
+    Note:
+        This class is immutable due to the `frozen=True` decorator. The arrays themselves are
+        not copied on access and must not be modified by callers.
+    """
+    products: List[ReactionProduct]
+    formulas: List[str]
+    coefficients: np.ndarray
+    is_condensed: np.ndarray
+    temperature_ranges: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.products)
+
+    def __iter__(self) -> Iterator[ReactionProduct]:
+        return iter(self.products)
+
+    def __getitem__(self, index: int) -> ReactionProduct:
+        return self.products[index]
+
+    def temperature_mask(self, temperature: float) -> np.ndarray:
+        """Returns a boolean mask of the products whose temperature range contains `temperature`.
+
+        Args:
+            temperature (float): Temperature in Kelvin.
+
+        Returns:
+            np.ndarray: Boolean mask (N), True where min <= temperature < max.
+        """
+        return (self.temperature_ranges[:, 0] <= temperature) & (temperature < self.temperature_ranges[:, 1])
+
+    def select(self, mask: np.ndarray) -> "ReactionProductTable":
+        """Returns a new table containing only the products selected by a boolean mask.
+
+        Args:
+            mask (np.ndarray): Boolean mask (N) over the products of this table.
+
+        Returns:
+            ReactionProductTable: Table of the selected products, preserving their order.
+        """
+        indices = np.flatnonzero(mask)
+        return ReactionProductTable(
+            products=[self.products[idx] for idx in indices],
+            formulas=[self.formulas[idx] for idx in indices],
+            coefficients=self.coefficients[indices],
+            is_condensed=self.is_condensed[indices],
+            temperature_ranges=self.temperature_ranges[indices]
+        )
@@ -9,7 +9,9 @@ by V.P. Glushko.
 
 Key functionalities include:
 - Optimizing the combustion temperature using root-finding methods.
-- Optimizing the composition of combustion products for a given temperature by minimizing Gibbs free energy.
+- Optimizing the composition of combustion products for a given temperature by minimizing Gibbs free energy
+  with SLSQP and an analytic gradient, restarting it from its last iterate and falling back to trust-constr
+  if it does not converge.
 - Ensuring mass balance constraints between the propellant and combustion products.
 
 Classes:
@@ -21,10 +23,11 @@ Classes:
 import numpy as np
 
 from scipy.optimize import minimize, LinearConstraint, root_scalar
-from typing import List
-
-from models import PropellantComposition, ReactionProduct
+from scipy.sparse import csr_matrix
+from typing import Tuple
+from models import PropellantComposition, ReactionProductTable
 from calculators import ThermodynamicSystemCalculator, ThermodynamicSystemContext
+from constants import GAS_CONSTANT
 from utils import (
     create_elemental_vector,
     filter_and_construct_matrices,
@@ -41,13 +44,25 @@ class CombustionCompositionOptimizer:
     Attributes:
         pressure (float): System pressure in Pascals (Pa).
         temperature (float): Current temperature in Kelvin.
-        propellant_vector (np.ndarray): Column vector representing the elemental composition of the propellant.
+        propellant_vector (np.ndarray): Vector representing the elemental composition of the propellant.
         stoichiometric_matrix (np.ndarray): Matrix of stoichiometric coefficients for the combustion products.
         initial_guess (np.ndarray): Initial guess for substance amounts (moles).
         coefficients (np.ndarray): Thermodynamic coefficients for the combustion products.
         is_condensed (np.ndarray): Boolean array indicating whether each product is in the condensed phase.
+        temperature_basis (np.ndarray): Temperature basis of the standard-state Gibbs energies, computed once
+            for `temperature`.
+        gibbs_coefficients (np.ndarray): Stacked Gibbs coefficients derived from `coefficients` (N × 16).
+        gas_indices (np.ndarray): Indices of the gas-phase products.
+        SLSQP_RESTARTS (int): Number of times SLSQP is restarted from its last iterate before falling back
+            to trust-constr.
+
+    Note:
+        The temperature-independent data is derived once at construction. An optimizer can be reused for
+        another temperature with the same set of products via `reset`.
     """
 
+    SLSQP_RESTARTS = 2
+
     def __init__(self,
                  pressure: float,
                  temperature: float,
@@ -63,51 +78,108 @@ class CombustionCompositionOptimizer:
         self.initial_guess = initial_guess
         self.coefficients = coefficients
         self.is_condensed = is_condensed
+        self.temperature_basis = ThermodynamicSystemCalculator.build_standard_gibbs_energy_basis(temperature)
+        self.gibbs_coefficients = ThermodynamicSystemCalculator.build_gibbs_coefficients(coefficients)
+        self.gas_indices = np.flatnonzero(~is_condensed)
+
+    def reset(self, temperature: float, initial_guess: np.ndarray) -> None:
+        """Prepare the optimizer for another temperature with the same set of products.
+
+        Args:
+            temperature (float): New temperature in Kelvin.
+            initial_guess (np.ndarray): Initial guess for substance amounts (moles).
+        """
+        self.temperature = temperature
+        self.initial_guess = initial_guess
+        self.temperature_basis = ThermodynamicSystemCalculator.build_standard_gibbs_energy_basis(temperature)
 
     def optimize(self) -> np.ndarray:
         """Optimize the composition of combustion products by minimizing Gibbs free energy.
 
+        SLSQP with the analytic gradient (the chemical potentials of the species) and the constant Jacobian
+        of the mass balance constraint is tried first, because it is fast when warm-started from a nearby
+        composition. If it stops without converging, it is restarted from its last iterate, which resets
+        its quasi-Newton Hessian approximation, up to `SLSQP_RESTARTS` times. If it still has not
+        converged, trust-constr is run from the SLSQP iterate.
+
+        Notes:
+            - Cold starts from the unit initial guess, such as the first probe at each end of the
+              temperature bracket, usually end in trust-constr. In the root searches at 1e3 to 2e7 Pa,
+              trust-constr solved 2 to 3 of the 11 to 14 probes; without the restarts it solved 2 to 7,
+              and each of those solves costs several times more than an SLSQP solve.
+
         Returns:
             np.ndarray: Optimized substance amounts (moles) for the combustion products.
+
+        Raises:
+            RuntimeError: If neither SLSQP nor trust-constr converges.
         """
-        # Set up optimization context
-        context = ThermodynamicSystemContext(
-            substance_amounts=self.initial_guess,
-            coefficients=self.coefficients,
-            is_condensed=self.is_condensed,
-            temperature=self.temperature,
-            pressure=self.pressure
-        )
+        # Standard-state Gibbs energies are fixed at this temperature; the objective and gradient are pure
+        # functions of the amounts
+        standard_gibbs_energies = self.gibbs_coefficients @ self.temperature_basis
+        gas_indices = self.gas_indices
+        temperature = self.temperature
+        pressure = self.pressure
+        gibbs_energy_kernel = ThermodynamicSystemCalculator.calculate_gibbs_energy_kernel
+        gibbs_energy_gradient_kernel = ThermodynamicSystemCalculator.calculate_gibbs_energy_gradient_kernel
+
+        # Gibbs energy is scaled to units of R*T so that the absolute SLSQP tolerance is meaningful
+        scale = 1.0 / (GAS_CONSTANT * temperature)
 
         def calculate_gibbs_energy(x):
-            context.substance_amounts = x
-            return ThermodynamicSystemCalculator.calculate_gibbs_energy(context)
-
-        # Define linear constraint for mass balance
-        linear_constraint = LinearConstraint(
-            self.stoichiometric_matrix,
-            self.propellant_vector.flatten(),
-            self.propellant_vector.flatten()
-        )
+            return scale * gibbs_energy_kernel(x, standard_gibbs_energies, gas_indices, temperature, pressure)
+
+        def calculate_gibbs_energy_gradient(x):
+            return scale * gibbs_energy_gradient_kernel(x, standard_gibbs_energies, gas_indices, temperature, pressure)
+
+        stoichiometric_matrix = self.stoichiometric_matrix
+        propellant_vector = self.propellant_vector.ravel()
 
         # Define bounds for variables (non-negative)
         bounds = [(0, None)] * len(self.initial_guess)
 
-        # Run optimization
-        result = minimize(
-            fun=calculate_gibbs_energy,
-            x0=self.initial_guess.flatten(),
-            method='trust-constr',
-            constraints=linear_constraint,
-            bounds=bounds,
-            options={
-                'verbose': 0,
-                'maxiter': 5000
-            }
-        )
+        # Run optimization with the mass balance as an equality constraint with constant Jacobian
+        x0 = self.initial_guess.ravel()
+        for _ in range(self.SLSQP_RESTARTS + 1):
+            result = minimize(
+                fun=calculate_gibbs_energy,
+                x0=x0,
+                jac=calculate_gibbs_energy_gradient,
+                method='SLSQP',
+                constraints={
+                    'type': 'eq',
+                    'fun': lambda x: stoichiometric_matrix @ x - propellant_vector,
+                    'jac': lambda x: stoichiometric_matrix
+                },
+                bounds=bounds,
+                options={
+                    'maxiter': 500,
+                    'ftol': 1e-12
+                }
+            )
+            if result.success:
+                break
+            x0 = result.x
+
+        if not result.success:
+            # Fall back to trust-constr, starting from the SLSQP iterate; the stoichiometric matrix has only a
+            # few nonzeros per column, so it is passed in sparse form for sparse KKT factorizations
+            linear_constraint = LinearConstraint(csr_matrix(stoichiometric_matrix), propellant_vector, propellant_vector)
+            result = minimize(
+                fun=calculate_gibbs_energy,
+                x0=result.x,
+                jac=calculate_gibbs_energy_gradient,
+                method='trust-constr',
+                constraints=linear_constraint,
+                bounds=bounds,
+                options={
+                    'verbose': 0,
+                    'maxiter': 5000
+                }
+            )
 
         if result.success:
-            return result.x.reshape(1, -1).flatten()
+            return result.x
         else:
             raise RuntimeError("Optimization failed to converge")
 
@@ -115,17 +187,30 @@ class TemperatureOptimizer:
     """Optimizes the combustion temperature to achieve thermodynamic equilibrium.
 
     This class optimizes the combustion temperature by minimizing the difference between the enthalpy
-    of the combustion products and the initial propellant. It uses a root-finding method (`brentq`) to
-    find the optimal temperature within a specified range.
+    of the combustion products and the initial propellant. It uses a root-finding method (`toms748`, with
+    `brentq` as a fallback) to find the optimal temperature within a specified range.
 
     Attributes:
         pressure (float): System pressure in Pascals (Pa).
         min_temperature (float): Minimum allowable temperature in Kelvin.
         max_temperature (float): Maximum allowable temperature in Kelvin.
         propellant (PropellantComposition): Propellant composition data.
-        products (List[ReactionProduct]): List of candidate reaction products.
-        propellant_vector (np.ndarray): Column vector representing the elemental composition of the propellant.
-        cached_initial_guess (Optional[np.ndarray]): Cached initial guess for substance amounts (moles).
+        products (ReactionProductTable): Table of candidate reaction products.
+        temperature_tolerance (float): Absolute tolerance of the optimal temperature in Kelvin.
+        propellant_vector (np.ndarray): 1-D vector representing the elemental composition of the propellant.
+        cached_initial_guess (Dict[FrozenSet[Tuple[str, str]], Tuple[Tuple[Tuple[str, str], ...], np.ndarray]]):
+            Optimized substance amounts (moles) from previous temperature probes, keyed by the set of
+            (formula, phase) species they were computed for. Each entry stores the species in solution
+            order together with the amounts.
+        breakpoints (np.ndarray): Sorted unique temperature range boundaries of all products in Kelvin.
+            The set of valid products is constant between two consecutive breakpoints.
+        bracket_cache (Dict[int, Tuple[ReactionProductTable, np.ndarray, np.ndarray, np.ndarray]]):
+            Filtered products, stoichiometric matrix, coefficients and condensed phase flags, keyed by the
+            index of the temperature bracket in `breakpoints`.
+        optimal_context (ThermodynamicSystemContext): Optimized context at the optimal temperature, set by `optimize`.
+        filtered_products (ReactionProductTable): Products valid at the most recently optimized temperature, in
+            the order of its substance amounts (read-only). After `optimize`, these match `optimal_context`.
+        stoichiometric_matrix (np.ndarray): Stoichiometric matrix of `filtered_products` (read-only).
     """
 
     def __init__(self,
@@ -133,33 +218,75 @@ class TemperatureOptimizer:
                  min_temperature: float,
                  max_temperature: float,
                  propellant: PropellantComposition,
-                 products: List[ReactionProduct]):
+                 products: ReactionProductTable,
+                 temperature_tolerance: float = 1e-3):
         self.pressure = pressure
         self.min_temperature = min_temperature
         self.max_temperature = max_temperature
         self.propellant = propellant
         self.products = products
-        self.propellant_vector = create_elemental_vector(propellant)
-        self.cached_initial_guess = None
+        self.temperature_tolerance = temperature_tolerance
+        self.propellant_vector = create_elemental_vector(propellant).ravel()
+        self.cached_initial_guess = {}
+        self.breakpoints = np.unique(products.temperature_ranges)
+        self.bracket_cache = {}
+        self.optimal_context = None
+        self._last_temperature = None
+        self._last_context = None
+        self._last_temp_filtered = None
+        self._last_stoichiometric_matrix = None
+        self._composition_optimizer = None
+
+    @property
+    def filtered_products(self) -> ReactionProductTable:
+        return self._last_temp_filtered
+
+    @property
+    def stoichiometric_matrix(self) -> np.ndarray:
+        return self._last_stoichiometric_matrix
 
     def optimize(self) -> float:
         """Optimize the combustion temperature using root-finding.
 
+        The root is bracketed with TOMS 748 to within `temperature_tolerance`, falling back to brentq if it
+        does not converge. If the last probed temperature lies within the tolerance of the root, it is
+        returned as the optimal temperature. The optimized context at the optimal temperature is stored in
+        `optimal_context`, and `filtered_products` then refers to that temperature, so callers do not need
+        to optimize the composition or filter the products at that temperature again.
+
         Returns:
             float: Optimal combustion temperature in Kelvin.
+
+        Raises:
+            ValueError: If the enthalpy error has the same sign at both temperature bounds.
+            RuntimeError: If the root-finding fails to converge, or if the composition optimization fails
+                at a probed temperature.
         """
-        left_bound = self.min_temperature
-        right_bound = self.max_temperature
+        bracket = [self.min_temperature, self.max_temperature]
 
-        # Use root_scalar with the 'brentq' method
         result = root_scalar(
             f=self._calculate_error,
-            bracket=[left_bound, right_bound],
-            method='brentq'
+            bracket=bracket,
+            method='toms748',
+            xtol=self.temperature_tolerance
         )
 
+        if not result.converged:
+            result = root_scalar(
+                f=self._calculate_error,
+                bracket=bracket,
+                method='brentq',
+                xtol=self.temperature_tolerance
+            )
+
         if result.converged:
-            return result.root
+            optimal_temperature = result.root
+            if abs(self._last_temperature - optimal_temperature) <= self.temperature_tolerance:
+                optimal_temperature = self._last_temperature
+            else:
+                self.optimize_context_at_temperature(optimal_temperature)
+            self.optimal_context = self._last_context
+            return optimal_temperature
         else:
             raise RuntimeError("Optimization failed to converge")
 
@@ -172,35 +299,35 @@ class TemperatureOptimizer:
         Returns:
             ThermodynamicSystemContext: Optimized thermodynamic system context for the given temperature.
         """
-        # Filter products by temperature and create stoichiometric matrix
-        temp_filtered, stoichiometric_matrix = filter_and_construct_matrices(
-            self.products, self.propellant, temperature
-        )
+        # Filter products and build matrices once per temperature bracket
+        temp_filtered, stoichiometric_matrix, coefficients, is_condensed = self._lookup_bracket(temperature)
 
         print(f"Optimizing context at temperature {temperature} K, found {len(temp_filtered)} temperature-compatible products.")
 
-        # Create optimization matrices
-        initial_guess, coefficients, is_condensed = prepare_optimization_matrices(
-            temp_filtered, temperature
-        )
+        initial_guess = np.ones(len(temp_filtered), dtype=np.float64)
 
-        # Check if initial guess is cached
-        if self.cached_initial_guess is not None and len(self.cached_initial_guess) == len(initial_guess):
-            initial_guess = self.cached_initial_guess
+        # Warm-start from the closest previously optimized species set
+        species = tuple((product.formula, product.phase) for product in temp_filtered)
+        initial_guess = self._lookup_initial_guess(species, initial_guess)
 
-        # Optimize combustion product composition
-        composition_optimizer = CombustionCompositionOptimizer(
-            pressure=self.pressure,
-            temperature=temperature,
-            propellant_vector=self.propellant_vector,
-            stoichiometric_matrix=stoichiometric_matrix,
-            initial_guess=initial_guess,
-            coefficients=coefficients,
-            is_condensed=is_condensed
-        )
+        # Optimize combustion product composition, reusing the optimizer while the bracket is unchanged
+        composition_optimizer = self._composition_optimizer
+        if composition_optimizer is not None and composition_optimizer.stoichiometric_matrix is stoichiometric_matrix:
+            composition_optimizer.reset(temperature, initial_guess)
+        else:
+            composition_optimizer = CombustionCompositionOptimizer(
+                pressure=self.pressure,
+                temperature=temperature,
+                propellant_vector=self.propellant_vector,
+                stoichiometric_matrix=stoichiometric_matrix,
+                initial_guess=initial_guess,
+                coefficients=coefficients,
+                is_condensed=is_condensed
+            )
+            self._composition_optimizer = composition_optimizer
 
         optimized_substance_amounts = composition_optimizer.optimize()
-        self.cached_initial_guess = optimized_substance_amounts
+        self.cached_initial_guess[frozenset(species)] = (species, optimized_substance_amounts)
 
         # Create and return the optimized context
         context = ThermodynamicSystemContext(
@@ -210,8 +337,76 @@ class TemperatureOptimizer:
             temperature=temperature,
             pressure=self.pressure
         )
+
+        self._last_temperature = temperature
+        self._last_context = context
+        self._last_temp_filtered = temp_filtered
+        self._last_stoichiometric_matrix = stoichiometric_matrix
         return context
 
+    def _lookup_bracket(self, temperature: float) -> Tuple[ReactionProductTable, np.ndarray, np.ndarray, np.ndarray]:
+        """Return the filtered products and optimization matrices for the bracket containing a temperature.
+
+        Products are valid on half-open ranges [min, max), so all temperatures that share the same
+        `searchsorted(..., side='right')` index in `breakpoints` have the same set of valid products.
+
+        Args:
+            temperature (float): Temperature in Kelvin.
+
+        Returns:
+            Tuple[ReactionProductTable, np.ndarray, np.ndarray, np.ndarray]: Filtered products,
+                stoichiometric matrix, thermodynamic coefficients and condensed phase flags.
+        """
+        bracket = int(np.searchsorted(self.breakpoints, temperature, side='right'))
+        cached = self.bracket_cache.get(bracket)
+        if cached is None:
+            temp_filtered, stoichiometric_matrix = filter_and_construct_matrices(
+                self.products, self.propellant, temperature
+            )
+            _, coefficients, is_condensed = prepare_optimization_matrices(temp_filtered, temperature)
+            cached = (temp_filtered, stoichiometric_matrix, coefficients, is_condensed)
+            self.bracket_cache[bracket] = cached
+        return cached
+
+    def _lookup_initial_guess(self, species: Tuple[Tuple[str, str], ...], default_guess: np.ndarray) -> np.ndarray:
+        """Build an initial guess for a species set from previously optimized substance amounts.
+
+        If the exact species set has been optimized before, its amounts are reused. Otherwise the cached
+        set with the largest Jaccard overlap is projected onto the current species order: amounts of
+        shared species are copied, and species that were not part of the cached set keep their default.
+        Cached amounts are floored at 1e-10 mol, because the gradient of a gas species at exactly zero
+        moles does not include its ln(p) term and the optimizer would not move it away from zero.
+
+        Args:
+            species (Tuple[Tuple[str, str], ...]): (formula, phase) of each species in solution order.
+            default_guess (np.ndarray): Initial guess used for species without a cached amount.
+
+        Returns:
+            np.ndarray: 1-D initial guess for substance amounts (moles), aligned with `species`, on every path.
+        """
+        if not self.cached_initial_guess:
+            return default_guess.ravel()
+
+        key = frozenset(species)
+        if key not in self.cached_initial_guess:
+            key = max(
+                self.cached_initial_guess,
+                key=lambda cached_key: len(cached_key & key) / len(cached_key | key)
+            )
+
+        cached_species, cached_amounts = self.cached_initial_guess[key]
+        cached_amounts = np.maximum(cached_amounts, 1e-10)
+        if cached_species == species:
+            return cached_amounts
+
+        cached_index = {item: idx for idx, item in enumerate(cached_species)}
+        initial_guess = default_guess.flatten()
+        for idx, item in enumerate(species):
+            cached_idx = cached_index.get(item)
+            if cached_idx is not None:
+                initial_guess[idx] = cached_amounts[cached_idx]
+        return initial_guess
+
     def _calculate_error(self, temperature: float) -> float:
         """Calculate the error (enthalpy difference) at a given temperature.
 
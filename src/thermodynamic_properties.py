@@ -12,25 +12,66 @@ import numpy as np
 from dataclasses import dataclass
 
 from calculators import ThermodynamicSystemCalculator, ThermodynamicSystemContext
+from models import ReactionProductTable
 from utils import parse_chemical_formula, compute_molar_mass
 from constants import GAS_CONSTANT
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ThermodynamicPropertiesContext:
     """Data class for storing thermodynamic properties of the optimized system.
 
     This data class stores various thermodynamic properties of a combustion system after optimization.
-    The properties include the thermodynamic system context, heat capacity, and average molar mass of gas products.
+    The properties include the thermodynamic system context, heat capacity, and average molar mass of gas products,
+    together with every other value shown in the console report.
 
     Attributes:
         thermodynamic_system_context (ThermodynamicSystemContext): Context containing system parameters such as
             temperature, pressure, substance amounts, coefficients, and phase information.
         specific_heat_capacity_volumetric (float): Volumetric heat capacity of the optimized system.
         gas_average_molar_mass (float): Average molar mass of gas products.
+        total_moles (float): Total moles of substances.
+        total_condensed_moles (float): Total moles of condensed-phase substances.
+        gibbs_energy (float): Total Gibbs free energy in J.
+        enthalpy (float): Total enthalpy in J.
+        entropy (float): Total entropy in J/K.
+        heat_capacity (float): Molar heat capacity of the gas phase in J/(mol·K).
+        heat_capacity_from_enthalpy (float): Heat capacity from a central difference of the enthalpy in J/K.
+        condensed_weight_fraction (float): Total weight fraction of condensed products.
+        specific_gas_constant (float): Specific gas constant of the gas products.
+        specific_heat_capacity (float): Specific heat capacity at constant pressure.
+        specific_heat_ratio (float): Ratio of the specific heat capacities.
     """
     thermodynamic_system_context: ThermodynamicSystemContext
     specific_heat_capacity_volumetric: float
     gas_average_molar_mass: float
+    total_moles: float
+    total_condensed_moles: float
+    gibbs_energy: float
+    enthalpy: float
+    entropy: float
+    heat_capacity: float
+    heat_capacity_from_enthalpy: float
+    condensed_weight_fraction: float
+    specific_gas_constant: float
+    specific_heat_capacity: float
+    specific_heat_ratio: float
+
+# Console report lines as (label, ThermodynamicPropertiesContext attribute), in display order
+_REPORT_FIELDS = (
+    ("Total moles", "total_moles"),
+    ("Total condensed moles", "total_condensed_moles"),
+    ("Final Gibbs Energy", "gibbs_energy"),
+    ("Final Enthalpy", "enthalpy"),
+    ("Final Entropy", "entropy"),
+    ("Final Heat Capacity (molar)", "heat_capacity"),
+    ("Final Heat Capacity (from enthalpy)", "heat_capacity_from_enthalpy"),
+    ("Total weight fraction of condensed products", "condensed_weight_fraction"),
+    ("Average molar mass of gas products", "gas_average_molar_mass"),
+    ("Specific gas constant", "specific_gas_constant"),
+    ("Heat capacity", "specific_heat_capacity"),
+    ("Specific heat ratio", "specific_heat_ratio"),
+    ("Volume heat capacity", "specific_heat_capacity_volumetric"),
+)
 
 class ThermodynamicPropertiesCalculator:
     """Class for calculating and displaying thermodynamic properties of the optimized system.
@@ -42,30 +83,56 @@ class ThermodynamicPropertiesCalculator:
     Attributes:
         context (ThermodynamicSystemContext): Context containing system parameters such as temperature,
             pressure, substance amounts, coefficients, and phase information.
-        filtered_products (list): List of filtered reaction products used in the optimization.
+        filtered_products (ReactionProductTable): Filtered reaction products used in the optimization.
 
     Methods:
-        calculate_and_display_properties(): Calculates and displays all thermodynamic properties.
+        calculate_and_display_properties() -> ThermodynamicPropertiesContext: Calculates and prints all
+            thermodynamic properties.
+        calculate_properties() -> ThermodynamicPropertiesContext: Calculates all thermodynamic properties
+            without printing them.
+        format_report(properties) -> str: Builds the console report of calculated properties.
+        print_report(properties): Prints the console report of calculated properties.
         _calculate_weight_fraction_of_condensed_products() -> float: Calculates the total weight fraction
             of condensed products.
     """
 
     def __init__(self,
                  context,
-                 filtered_products: list):
+                 filtered_products: ReactionProductTable):
         """
         Args:
             context (ThermodynamicSystemContext): Context containing system parameters such as temperature,
                 pressure, substance amounts, coefficients, and phase information.
-            filtered_products (list): List of filtered reaction products used in the optimization.
+            filtered_products (ReactionProductTable): Filtered reaction products used in the optimization.
         """
         self.context = context
         self.filtered_products = filtered_products
+        self._molar_masses = np.fromiter(
+            (compute_molar_mass(parse_chemical_formula(product.formula)) for product in filtered_products),
+            dtype=np.float64,
+            count=len(filtered_products)
+        )
+        self._condensed_molar_masses = self._molar_masses * context.condensed_mask
+        self._enthalpy_scratch = np.empty(len(filtered_products), dtype=np.float64)
 
     def calculate_and_display_properties(self) -> ThermodynamicPropertiesContext:
-        """Calculate and display all thermodynamic properties of the optimized system.
+        """Calculate all thermodynamic properties of the optimized system and print them.
+
+        Returns:
+            ThermodynamicPropertiesContext: Properties of the optimized system.
+
+        Notes:
+            - This is `calculate_properties` followed by `print_report`; the whole report is
+              written to the console in a single call.
+        """
+        properties = self.calculate_properties()
+        self.print_report(properties)
+        return properties
 
-        This method computes and prints the following thermodynamic properties:
+    def calculate_properties(self) -> ThermodynamicPropertiesContext:
+        """Calculate all thermodynamic properties of the optimized system without printing them.
+
+        This method computes the following thermodynamic properties:
         - Total moles of substances.
         - Total condensed moles and gas-phase moles.
         - Gibbs free energy, enthalpy, entropy, and heat capacity.
@@ -74,61 +141,86 @@ class ThermodynamicPropertiesCalculator:
         - Average molar mass of gas products.
         - Specific gas constant, heat capacity, heat ratio, and volume heat capacity.
 
+        Returns:
+            ThermodynamicPropertiesContext: Properties of the optimized system.
+
         Notes:
-            - The results are printed directly to the console.
+            - Nothing is printed; pass the result to `print_report` or `format_report` to display it.
             - The context's `substance_amounts` attribute contains the optimized amounts.
         """
 
         # Basic properties
         total_moles = self.context.substance_amounts.sum()
-        total_condensed_moles = np.sum(self.context.substance_amounts * self.context.is_condensed)
+        total_condensed_moles = float(np.dot(self.context.substance_amounts, self.context.condensed_mask))
         total_gas_moles = total_moles - total_condensed_moles
 
-        print("Total moles:", total_moles)
-        print("Total condensed moles:", total_condensed_moles)
-
         # Gibbs energy, enthalpy, entropy, and heat capacity
-        final_gibbs_energy = ThermodynamicSystemCalculator.calculate_gibbs_energy(self.context)
-        final_enthalpy = ThermodynamicSystemCalculator.calculate_enthalpy(self.context)
-        final_entropy = ThermodynamicSystemCalculator.calculate_entropy(self.context)
+        final_enthalpy, final_entropy, final_gibbs_energy = ThermodynamicSystemCalculator.calculate_totals(self.context)
         final_heat_capacity = ThermodynamicSystemCalculator.calculate_heat_capacity(self.context)
 
-        print("Final Gibbs Energy:", final_gibbs_energy)
-        print("Final Enthalpy:", final_enthalpy)
-        print("Final Entropy:", final_entropy)
-        print("Final Heat Capacity (molar):", final_heat_capacity)
-
-        # Heat capacity from enthalpy
+        # Heat capacity from enthalpy by central difference; the context temperature is restored afterwards
         delta_temperature = 1e-3
-        self.context.temperature += delta_temperature
-        c_p_from_enthalpy = (ThermodynamicSystemCalculator.calculate_enthalpy(self.context) - final_enthalpy) / delta_temperature
-        print("Final Heat Capacity (from enthalpy):", c_p_from_enthalpy)
+        temperature = self.context.temperature
+        try:
+            self.context.temperature = temperature + delta_temperature
+            upper_enthalpy = ThermodynamicSystemCalculator.calculate_enthalpy(self.context, out=self._enthalpy_scratch)
+            self.context.temperature = temperature - delta_temperature
+            lower_enthalpy = ThermodynamicSystemCalculator.calculate_enthalpy(self.context, out=self._enthalpy_scratch)
+        finally:
+            self.context.temperature = temperature
+        c_p_from_enthalpy = (upper_enthalpy - lower_enthalpy) / (2 * delta_temperature)
 
         # Weight fraction of condensed products
         total_weight_fraction = self._calculate_weight_fraction_of_condensed_products()
-        print("Total weight fraction of condensed products:", total_weight_fraction)
 
         # Average molar mass of gas products
         average_molar_mass = (1 - total_weight_fraction) / total_gas_moles
-        print("Average molar mass of gas products:", average_molar_mass)
 
         # Specific gas constant and heat capacity
         specific_gas_constant = GAS_CONSTANT / average_molar_mass
         specific_heat_capacity = final_heat_capacity / average_molar_mass
-        specific_heat_ratio = specific_heat_capacity / (specific_heat_capacity - specific_gas_constant)
         volume_heat_capacity = specific_heat_capacity - specific_gas_constant
-
-        print("Specific gas constant:", specific_gas_constant)
-        print("Heat capacity:", specific_heat_capacity)
-        print("Specific heat ratio:", specific_heat_ratio)
-        print("Volume heat capacity:", volume_heat_capacity)
+        specific_heat_ratio = specific_heat_capacity / volume_heat_capacity
 
         return ThermodynamicPropertiesContext(
             thermodynamic_system_context=self.context,
             specific_heat_capacity_volumetric=volume_heat_capacity,
-            gas_average_molar_mass=average_molar_mass
+            gas_average_molar_mass=average_molar_mass,
+            total_moles=total_moles,
+            total_condensed_moles=total_condensed_moles,
+            gibbs_energy=final_gibbs_energy,
+            enthalpy=final_enthalpy,
+            entropy=final_entropy,
+            heat_capacity=final_heat_capacity,
+            heat_capacity_from_enthalpy=c_p_from_enthalpy,
+            condensed_weight_fraction=total_weight_fraction,
+            specific_gas_constant=specific_gas_constant,
+            specific_heat_capacity=specific_heat_capacity,
+            specific_heat_ratio=specific_heat_ratio
         )
 
+    @staticmethod
+    def format_report(properties: ThermodynamicPropertiesContext) -> str:
+        """Build the console report of calculated properties.
+
+        Args:
+            properties (ThermodynamicPropertiesContext): Properties returned by `calculate_properties`.
+
+        Returns:
+            str: One "label: value" line per property, formatted as `print(label + ":", value)` would
+                format it, joined with newlines.
+        """
+        return "\n".join(f"{label}: {getattr(properties, name)}" for label, name in _REPORT_FIELDS)
+
+    @staticmethod
+    def print_report(properties: ThermodynamicPropertiesContext) -> None:
+        """Print the console report of calculated properties in a single write.
+
+        Args:
+            properties (ThermodynamicPropertiesContext): Properties returned by `calculate_properties`.
+        """
+        print(ThermodynamicPropertiesCalculator.format_report(properties))
+
     def _calculate_weight_fraction_of_condensed_products(self) -> float:
         """Calculate the total weight fraction of condensed products.
 
@@ -140,14 +232,9 @@ class ThermodynamicPropertiesCalculator:
             float: Total weight fraction of condensed products.
 
         Notes:
-            - The molar mass of each species is computed using its chemical formula and the `compute_molar_mass`
-              utility function.
+            - The molar masses of the species are computed once at construction from their chemical formulas
+              using the `compute_molar_mass` utility function, and zeroed for gas-phase species so that
+              the sum is a single dot product with the amounts.
             - Only condensed-phase species (as indicated by `is_condensed`) are included in the calculation.
         """
-        total_weight_fraction = 0.0
-        for product, amount, is_condensed_flag in zip(self.filtered_products, self.context.substance_amounts, self.context.is_condensed):
-            if is_condensed_flag:
-                elements = parse_chemical_formula(product.formula)
-                molar_mass = compute_molar_mass(elements)
-                total_weight_fraction += molar_mass * amount
-        return total_weight_fraction
+        return float(np.dot(self.context.substance_amounts, self._condensed_molar_masses))
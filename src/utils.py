@@ -13,38 +13,66 @@ Key functionalities include:
 Functions:
     create_elemental_vector(propellant_composition: PropellantComposition) -> np.ndarray:
         Creates a column vector representation of element quantities from propellant composition.
-    parse_chemical_formula(formula: str) -> Dict[str, int]:
+    parse_chemical_formula(formula: str) -> Mapping[str, int]:
         Parses a chemical formula into its constituent elements with stoichiometric counts.
-    compute_molar_mass(elements: Dict[str, int]) -> float:
+    compute_molar_mass(elements: Mapping[str, int]) -> float:
         Calculates the molar mass of a compound from its elemental composition.
-    filter_products_by_elements(reaction_products: List[ReactionProduct],
-                               propellant_composition: PropellantComposition) -> List[ReactionProduct]:
+    filter_products_by_elements(reaction_products: ReactionProductTable,
+                               propellant_composition: PropellantComposition) -> ReactionProductTable:
         Filters reaction products to include only those composed of elements present in the propellant.
-    construct_stoichiometric_matrix(filtered_products: List[ReactionProduct],
+    construct_stoichiometric_matrix(filtered_products: ReactionProductTable,
                                     propellant_composition: PropellantComposition) -> np.ndarray:
         Constructs a stoichiometric matrix aligned with the elements in the propellant composition.
-    filter_and_construct_matrices(reaction_products: List[ReactionProduct],
+    filter_and_construct_matrices(reaction_products: ReactionProductTable,
                                  propellant: PropellantComposition,
-                                 temperature: float) -> Tuple[List[ReactionProduct], np.ndarray]:
+                                 temperature: float) -> Tuple[ReactionProductTable, np.ndarray]:
         Filters products by temperature and constructs the corresponding stoichiometric matrix.
-    prepare_optimization_matrices(reaction_products: List[ReactionProduct],
+    prepare_optimization_matrices(reaction_products: ReactionProductTable,
                                   temperature_kelvin: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         Prepares matrices for thermodynamic optimization, including initial guesses and condensed phase flags.
     compute_total_mass(propellant_composition: PropellantComposition) -> float:
         Calculates the total mass of the propellant based on its elemental composition.
 """
 
+import re
 import numpy as np
 
-from typing import List, Dict, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import FrozenSet, Iterable, Mapping, Tuple
 
-from models import ReactionProduct, PropellantComposition
+from models import ReactionProductTable, PropellantComposition
 from molar_masses import ELEMENT_MOLAR_MASSES
 
+# Element symbol (1 uppercase + 0+ lowercase) followed by an optional count
+_FORMULA_TOKEN = re.compile(r'([A-Z][a-z]*)(\d*)')
+
+# Molar masses of all known elements as a vector, indexed through the symbol -> index map
+_ELEMENT_INDEX = {element: idx for idx, element in enumerate(ELEMENT_MOLAR_MASSES)}
+_ELEMENT_MASS_VECTOR = np.fromiter(ELEMENT_MOLAR_MASSES.values(), dtype=np.float64, count=len(ELEMENT_MOLAR_MASSES))
+
+def _element_molar_masses(elements: Iterable[str]) -> np.ndarray:
+    """Gathers the molar masses of the given elements from the element mass vector.
+
+    Args:
+        elements (Iterable[str]): Element symbols.
+
+    Returns:
+        np.ndarray: Molar masses in kg/mol, in the order of `elements`.
+
+    Raises:
+        KeyError: If any element is not found in `ELEMENT_MOLAR_MASSES`.
+    """
+    try:
+        indices = [_ELEMENT_INDEX[element] for element in elements]
+    except KeyError as error:
+        raise KeyError(f"Element '{error.args[0]}' not found in molar mass database.") from None
+    return _ELEMENT_MASS_VECTOR[indices]
+
 def create_elemental_vector(propellant_composition: PropellantComposition) -> np.ndarray:
     """Creates a column vector representation of element quantities from propellant composition.
 
-    The row order corresponds to the order of element symbols in `propellant_composition.composition.keys()`.
+    The row order corresponds to the order of element symbols in `propellant_composition.elements`.
 
     Args:
         propellant_composition (PropellantComposition): Contains chemical composition data.
@@ -52,10 +80,10 @@ def create_elemental_vector(propellant_composition: PropellantComposition) -> np
     Returns:
         np.ndarray: A 2D column vector (n × 1) with element quantities in moles.
     """
-    element_quantities = list(propellant_composition.composition.values())
-    return np.vstack(element_quantities)
+    return propellant_composition.moles.reshape(-1, 1).copy()
 
-def parse_chemical_formula(formula: str) -> Dict[str, int]:
+@lru_cache(maxsize=4096)
+def parse_chemical_formula(formula: str) -> Mapping[str, int]:
     """Parses a chemical formula into its constituent elements with stoichiometric counts.
 
     Correctly handles:
@@ -63,48 +91,59 @@ def parse_chemical_formula(formula: str) -> Dict[str, int]:
     - Implicit counts (e.g., O = O1).
     - Complex formulas (e.g., Fe3O4, C6H5OH).
 
+    The formula is tokenized with a precompiled regular expression; tokens must cover the whole formula.
+    Counts of elements that appear more than once are summed. Results are memoized per formula and
+    returned as read-only mappings, since the same instance is shared between callers.
+
     Args:
         formula (str): Chemical formula following standard notation.
 
     Returns:
-        Dict[str, int]: Dictionary mapping element symbols to their integer counts.
+        Mapping[str, int]: Read-only mapping of element symbols to their integer counts.
 
     Raises:
         ValueError: If the formula contains invalid characters or structure.
     """
     elements = {}
-    i = 0
-    n = len(formula)
-
-    while i < n:
-        # Element symbol must start with an uppercase letter
-        if not formula[i].isupper():
-            raise ValueError(f"Invalid character '{formula[i]}' at position {i} - elements must start with uppercase.")
-
-        # Capture element symbol (1 uppercase + 0+ lowercase)
-        element = [formula[i]]
-        i += 1
-        while i < n and formula[i].islower():
-            element.append(formula[i])
-            i += 1
-        element = ''.join(element)
-
-        # Capture numeric count
-        count = []
-        while i < n and formula[i].isdigit():
-            count.append(formula[i])
-            i += 1
+    position = 0
+
+    for match in _FORMULA_TOKEN.finditer(formula):
+        # Tokens must be contiguous; a gap means an element did not start with an uppercase letter
+        if match.start() != position:
+            break
 
         # Store element with count (default 1 if unspecified)
-        elements[element] = int(''.join(count)) if count else 1
+        element, count = match.groups()
+        elements[element] = elements.get(element, 0) + (int(count) if count else 1)
+        position = match.end()
+
+    if position != len(formula):
+        raise ValueError(f"Invalid character '{formula[position]}' at position {position} - elements must start with uppercase.")
+
+    return MappingProxyType(elements)
+
+@lru_cache(maxsize=4096)
+def _formula_elements(formula: str) -> FrozenSet[str]:
+    """Returns the set of element symbols in a chemical formula.
+
+    Args:
+        formula (str): Chemical formula following standard notation.
 
-    return elements
+    Returns:
+        FrozenSet[str]: Element symbols present in the formula.
+
+    Raises:
+        ValueError: If the formula contains invalid characters or structure.
+    """
+    return frozenset(parse_chemical_formula(formula))
 
-def compute_molar_mass(elements: Dict[str, int]) -> float:
+def compute_molar_mass(elements: Mapping[str, int]) -> float:
     """Calculates the molar mass of a compound from its elemental composition.
 
+    Results are memoized per elemental composition.
+
     Args:
-        elements (Dict[str, int]): Dictionary of elements and their counts (from `parse_chemical_formula`).
+        elements (Mapping[str, int]): Mapping of elements and their counts (from `parse_chemical_formula`).
 
     Returns:
         float: Molar mass in kg/mol.
@@ -112,85 +151,98 @@ def compute_molar_mass(elements: Dict[str, int]) -> float:
     Raises:
         KeyError: If any element is not found in `ELEMENT_MOLAR_MASSES`.
     """
-    molar_mass = 0.0
+    return _compute_molar_mass(tuple(elements.items()))
+
+@lru_cache(maxsize=4096)
+def _compute_molar_mass(elements: Tuple[Tuple[str, int], ...]) -> float:
+    """Calculates the molar mass of a compound from hashable (element, count) pairs.
 
-    for element, count in elements.items():
-        if element not in ELEMENT_MOLAR_MASSES:
-            raise KeyError(f"Element '{element}' not found in molar mass database.")
-        molar_mass += ELEMENT_MOLAR_MASSES[element] * count
+    Args:
+        elements (Tuple[Tuple[str, int], ...]): Elements and their counts.
 
-    return molar_mass
+    Returns:
+        float: Molar mass in kg/mol.
 
-def filter_products_by_elements(reaction_products: List[ReactionProduct],
-                               propellant_composition: PropellantComposition) -> List[ReactionProduct]:
+    Raises:
+        KeyError: If any element is not found in `ELEMENT_MOLAR_MASSES`.
+    """
+    if not elements:
+        return 0.0
+
+    symbols, counts = zip(*elements)
+    return float(np.dot(_element_molar_masses(symbols), counts))
+
+def filter_products_by_elements(reaction_products: ReactionProductTable,
+                               propellant_composition: PropellantComposition) -> ReactionProductTable:
     """Filters reaction products to include only those composed of elements present in the propellant.
 
     Args:
-        reaction_products (List[ReactionProduct]): Candidate reaction products.
+        reaction_products (ReactionProductTable): Candidate reaction products.
         propellant_composition (PropellantComposition): Reference composition for filtering.
 
     Returns:
-        List[ReactionProduct]: Products whose ALL constituent elements exist in the propellant composition.
+        ReactionProductTable: Products whose ALL constituent elements exist in the propellant composition.
 
     Examples:
         Propellant contains ['C', 'H', 'O']:
         - Kept: H2O (H, O), CO2 (C, O)
         - Removed: NaCl (Na, Cl), CH3Cl (C, H, Cl)
     """
-    propellant_elements = set(propellant_composition.composition.keys())
+    propellant_elements = frozenset(propellant_composition.elements)
 
-    return [
-        product for product in reaction_products
-        if propellant_elements.issuperset(parse_chemical_formula(product.formula))
-    ]
+    mask = np.fromiter(
+        (propellant_elements >= _formula_elements(formula) for formula in reaction_products.formulas),
+        dtype=bool,
+        count=len(reaction_products)
+    )
+    return reaction_products.select(mask)
 
-def construct_stoichiometric_matrix(filtered_products: List[ReactionProduct],
+def construct_stoichiometric_matrix(filtered_products: ReactionProductTable,
                                     propellant_composition: PropellantComposition) -> np.ndarray:
     """Constructs a stoichiometric matrix aligned with the elements in the propellant composition.
 
     Matrix dimensions: (num_propellant_elements × num_filtered_products)
-    Row order matches `propellant_composition.composition.keys()` order.
+    Row order matches `propellant_composition.elements` order.
 
     Args:
-        filtered_products (List[ReactionProduct]): Reaction products containing propellant elements.
+        filtered_products (ReactionProductTable): Reaction products containing propellant elements.
         propellant_composition (PropellantComposition): Defines row order and relevant elements.
 
     Returns:
         np.ndarray: Stoichiometric coefficients matrix (n_elements × n_products).
     """
-    elements = list(propellant_composition.composition.keys())
-    matrix = np.zeros((len(elements), len(filtered_products)), dtype=np.float64)
+    element_index = propellant_composition.element_index
+    matrix = np.zeros((len(element_index), len(filtered_products)), dtype=np.float64)
 
-    for col_idx, product in enumerate(filtered_products):
-        counts = parse_chemical_formula(product.formula)
-        for row_idx, element in enumerate(elements):
-            matrix[row_idx, col_idx] = counts.get(element, 0.0)
+    # Only the elements present in each formula are written; all other entries stay zero
+    for col_idx, formula in enumerate(filtered_products.formulas):
+        for element, count in parse_chemical_formula(formula).items():
+            row_idx = element_index.get(element)
+            if row_idx is not None:
+                matrix[row_idx, col_idx] = count
 
     return matrix
 
 def filter_and_construct_matrices(
-    reaction_products: List[ReactionProduct],
+    reaction_products: ReactionProductTable,
     propellant: PropellantComposition,
     temperature: float
-) -> Tuple[List[ReactionProduct], np.ndarray]:
+) -> Tuple[ReactionProductTable, np.ndarray]:
     """Filters products by temperature and constructs the corresponding stoichiometric matrix.
 
     Args:
-        reaction_products (List[ReactionProduct]): List of all reaction products.
+        reaction_products (ReactionProductTable): Table of all reaction products.
         propellant (PropellantComposition): Propellant composition reference.
         temperature (float): Target temperature in Kelvin.
 
     Returns:
-        Tuple[List[ReactionProduct], np.ndarray]: Filtered products and stoichiometric matrix.
+        Tuple[ReactionProductTable, np.ndarray]: Filtered products and stoichiometric matrix.
     """
     # First filter by element compatibility
     element_filtered = filter_products_by_elements(reaction_products, propellant)
 
     # Then filter by temperature validity
-    temp_filtered = [
-        p for p in element_filtered
-        if p.temperature_range.min <= temperature < p.temperature_range.max
-    ]
+    temp_filtered = element_filtered.select(element_filtered.temperature_mask(temperature))
 
     # Create stoichiometric matrix
     matrix = construct_stoichiometric_matrix(temp_filtered, propellant)
@@ -198,13 +250,13 @@ def filter_and_construct_matrices(
     return temp_filtered, matrix
 
 def prepare_optimization_matrices(
-    reaction_products: List[ReactionProduct],
+    reaction_products: ReactionProductTable,
     temperature_kelvin: float
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """Prepares matrices for thermodynamic optimization, including initial guesses and condensed phase flags.
 
     Args:
-        reaction_products (List[ReactionProduct]): List of ReactionProduct objects.
+        reaction_products (ReactionProductTable): Table of reaction products.
         temperature_kelvin (float): Target temperature in Kelvin.
 
     Returns:
@@ -219,28 +271,17 @@ def prepare_optimization_matrices(
     if temperature_kelvin <= 0:
         raise ValueError(f"Invalid temperature: {temperature_kelvin} K")
 
-    # Filter valid products
-    valid_products = [
-        p for p in reaction_products
-        if p.temperature_range.min <= temperature_kelvin < p.temperature_range.max
-    ]
+    # Select valid products
+    valid_mask = reaction_products.temperature_mask(temperature_kelvin)
+    n_products = int(np.count_nonzero(valid_mask))
 
-    if not valid_products:
+    if n_products == 0:
         raise ValueError(f"No valid products at {temperature_kelvin} K")
 
-    # Initialize matrices
-    n_products = len(valid_products)
+    # Initialize matrices; the table guarantees 9 coefficients per product
     initial_guess = np.ones((n_products, 1), dtype=np.float64)
-    is_condensed = np.zeros(n_products, dtype=bool)
-
-    # 9 coefficients per NASA polynomial
-    coeff_matrix = np.zeros((n_products, 9), dtype=np.float64)
-    for idx, product in enumerate(valid_products):
-        if len(product.coefficients) != 9:
-            raise ValueError(f"Invalid coefficients for {product.formula}")
-
-        coeff_matrix[idx] = product.coefficients
-        is_condensed[idx] = product.is_condensed
+    coeff_matrix = reaction_products.coefficients[valid_mask]
+    is_condensed = reaction_products.is_condensed[valid_mask]
 
     return initial_guess, coeff_matrix, is_condensed
 
@@ -261,11 +302,5 @@ def compute_total_mass(propellant_composition: PropellantComposition) -> float:
     Raises:
         KeyError: If any element in the composition is not found in the molar mass database.
     """
-    total_mass = 0.0
-
-    for element, moles in propellant_composition.composition.items():
-        if element not in ELEMENT_MOLAR_MASSES:
-            raise KeyError(f"Element '{element}' not found in molar mass database.")
-        total_mass += moles * ELEMENT_MOLAR_MASSES[element]
-
-    return total_mass
+    molar_masses = _element_molar_masses(propellant_composition.elements)
+    return float(np.dot(propellant_composition.moles, molar_masses))